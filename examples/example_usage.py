@@ -13,7 +13,8 @@ This script demonstrates how to:
 import asyncio
 import os
 import sys
-from datetime import datetime, timedelta
+from contextlib import AsyncExitStack
+from datetime import datetime, timedelta, timezone
 
 # Add the parent directory to Python path to import social_scrubber
 sys.path.insert(
@@ -23,7 +24,7 @@ sys.path.insert(
 from social_scrubber.config import Config  # noqa: E402
 from social_scrubber.platforms.bluesky import BlueskyPlatform  # noqa: E402
 from social_scrubber.platforms.mastodon import MastodonPlatform  # noqa: E402
-from social_scrubber.utils import display_posts_table  # noqa: E402
+from social_scrubber.utils import display_posts_table, install_uvloop  # noqa: E402
 
 
 async def main():
@@ -35,65 +36,86 @@ async def main():
     config = Config.from_env()
 
     # Calculate date range (last 3 days)
-    end_date = datetime.now()
+    end_date = datetime.now(timezone.utc)
     start_date = end_date - timedelta(days=3)
 
     print(
         f"📅 Looking for posts from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
     )
 
-    # Initialize platforms
-    platforms = []
-
-    # Add Bluesky if configured
-    if config.bluesky.is_configured:
-        platforms.append(("bluesky", BlueskyPlatform(config.bluesky)))
-
-    # Add Mastodon if configured
-    if config.mastodon.is_configured:
-        platforms.append(("mastodon", MastodonPlatform(config.mastodon)))
-
-    if not platforms:
-        print("❌ No platforms configured. Please set up your .env file.")
-        return
-
-    # Authenticate with platforms
-    for platform_name, platform in platforms:
-        print(f"\n🔐 Authenticating with {platform_name.title()}...")
-        success = await platform.authenticate()
-
-        if not success:
-            print(f"❌ Failed to authenticate with {platform_name}")
-            continue
+    # Every platform is used as an async context manager, so its HTTP
+    # session is closed when the block exits
+    async with AsyncExitStack() as stack:
+        # Initialize platforms
+        platforms = []
+
+        # Add Bluesky if configured
+        if config.bluesky.is_configured:
+            bluesky = await stack.enter_async_context(BlueskyPlatform(config.bluesky))
+            platforms.append(("bluesky", bluesky))
+
+        # Add Mastodon if configured
+        if config.mastodon.is_configured:
+            mastodon = await stack.enter_async_context(
+                MastodonPlatform(config.mastodon)
+            )
+            platforms.append(("mastodon", mastodon))
+
+        if not platforms:
+            print("❌ No platforms configured. Please set up your .env file.")
+            return
+
+        async def fetch_posts(platform_name, platform):
+            """Authenticate with a platform and fetch its recent posts."""
+            print(f"\n🔐 Authenticating with {platform_name.title()}...")
+            success = await platform.authenticate()
+
+            if not success:
+                print(f"❌ Failed to authenticate with {platform_name}")
+                return None
+
+            print(f"📥 Fetching posts from {platform_name.title()}...")
+            return await platform.get_posts(
+                start_date=start_date,
+                end_date=end_date,
+                limit=5,  # Limit to 5 posts for this example
+            )
 
-        # Fetch posts
-        print(f"📥 Fetching posts from {platform_name.title()}...")
-        posts = await platform.get_posts(
-            start_date=start_date,
-            end_date=end_date,
-            limit=5,  # Limit to 5 posts for this example
+        # Authenticate and fetch from every platform before rendering anything,
+        # so that table rendering never holds up the other platforms' requests
+        all_posts = await asyncio.gather(
+            *(
+                fetch_posts(platform_name, platform)
+                for platform_name, platform in platforms
+            )
         )
 
-        if posts:
-            print(f"✅ Found {len(posts)} posts")
-            display_posts_table(posts, f"{platform_name.title()} Posts")
+        for (platform_name, _), posts in zip(platforms, all_posts):
+            if posts is None:
+                continue
 
-            # Example: Preview what would be deleted (dry run)
-            print(f"\n🔍 This is what would be deleted from {platform_name.title()}:")
-            for post in posts:
-                print(f"  • {post}")
+            display_name = platform_name.title()
+            if posts:
+                print(f"\n✅ Found {len(posts)} posts on {display_name}")
+                display_posts_table(posts, f"{display_name} Posts")
 
-            # Note: In a real scenario, you would ask for user confirmation
-            # before proceeding with actual deletion
-            print(
-                "\n💡 To actually delete these posts, set DRY_RUN=false in your .env file"
-            )
+                # Example: Preview what would be deleted (dry run)
+                print(f"\n🔍 This is what would be deleted from {display_name}:")
+                for post in posts:
+                    print(f"  • {post}")
+
+                # Note: In a real scenario, you would ask for user confirmation
+                # before proceeding with actual deletion
+                print(
+                    "\n💡 To actually delete these posts, set DRY_RUN=false in your .env file"
+                )
 
-        else:
-            print("ℹ️ No posts found in the specified date range")
+            else:
+                print(f"ℹ️ No posts found on {display_name} in the date range")
 
     print("\n✅ Example script completed!")
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
@@ -48,7 +48,7 @@ echo "✅ Security check completed"
 
 echo
 echo "6️⃣ All Tests (pytest)..."
-python -m pytest tests/ --tb=short -v
+python -m pytest tests/ --tb=short -v -n auto --dist loadfile
 echo "✅ All tests passed"
 
 echo
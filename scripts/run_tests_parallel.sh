@@ -0,0 +1,43 @@
+#!/bin/bash
+
+# Run each test file in its own pytest process, several at a time
+# Works without pytest-xdist; JUnit XML for every file goes to test-results/
+
+set -u
+
+cd "$(dirname "$0")/.."
+
+# Leave two cores for the rest of the system, but always run at least one
+jobs=$(( $(nproc 2>/dev/null || echo 1) - 2 ))
+if [ "$jobs" -lt 1 ]; then
+    jobs=1
+fi
+
+results_dir="${TEST_RESULTS_DIR:-test-results}"
+mkdir -p "$results_dir"
+
+echo "🧪 Running test files with $jobs parallel job(s)..."
+
+# xargs exits non-zero if any pytest process failed
+ls tests/test_*.py | xargs -P "$jobs" -n 1 sh -c '
+    results_dir=$1 file=$2
+    name=$(basename "$file" .py)
+    python -m pytest "$file" -q -p no:cacheprovider \
+        --junitxml="$results_dir/$name.xml" > "$results_dir/$name.log" 2>&1
+    status=$?
+    if [ $status -eq 0 ]; then
+        echo "✅ $file"
+    else
+        echo "❌ $file"
+        cat "$results_dir/$name.log"
+    fi
+    exit $status
+' _ "$results_dir"
+status=$?
+
+if [ $status -eq 0 ]; then
+    echo "✅ All tests passed"
+else
+    echo "❌ Some tests failed; JUnit reports are in $results_dir/"
+fi
+exit $status
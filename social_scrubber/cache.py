@@ -0,0 +1,141 @@
+"""On-disk cache for post listings fetched from platforms."""
+
+import hashlib
+import json
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from .platforms.base import Post
+
+logger = logging.getLogger(__name__)
+
+# Default number of seconds a cached post listing stays valid
+DEFAULT_CACHE_TTL = 300
+
+
+class PostCache:
+    """Cache of post listings keyed by platform, account, date range and limit.
+
+    Each listing is stored as one JSON file named after the platform, so that
+    all listings of a platform can be dropped once posts have been deleted
+    from it. Cache failures are logged and otherwise ignored; a broken cache
+    only ever costs a refetch.
+    """
+
+    def __init__(self, cache_dir: str, ttl: float = DEFAULT_CACHE_TTL):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory to store cached listings in
+            ttl: Number of seconds a cached listing stays valid
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(
+        platform_name: str,
+        account: str,
+        start_date: datetime,
+        end_date: datetime,
+        limit: Optional[int] = None,
+    ) -> str:
+        """Build the cache key for a post listing.
+
+        Dates are truncated to the minute so that relative ranges such as
+        "7_days_ago" still hit the cache when a run follows a preview.
+
+        Args:
+            platform_name: Name of the platform
+            account: Account the posts belong to, so that switching accounts
+                never serves the previous account's posts
+            start_date: Start of the date range
+            end_date: End of the date range
+            limit: Maximum number of posts requested
+
+        Returns:
+            Cache key, prefixed with the platform name
+        """
+        start = start_date.replace(second=0, microsecond=0).isoformat()
+        end = end_date.replace(second=0, microsecond=0).isoformat()
+        digest = hashlib.sha1(
+            f"{platform_name}|{account}|{start}|{end}|{limit}".encode("utf-8")
+        ).hexdigest()
+        return f"{platform_name}_{digest}"
+
+    def get(self, key: str) -> Optional[List[Post]]:
+        """Return the cached posts for a key, or None on a miss.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            List of cached posts, or None if missing or expired
+        """
+        filepath = self.cache_dir / f"{key}.json"
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {filepath}: {e}")
+            return None
+
+        if time.time() - entry["stored_at"] > self.ttl:
+            return None
+
+        return [
+            Post(
+                id=item["id"],
+                content=item["content"],
+                created_at=datetime.fromisoformat(item["created_at"]),
+                platform=item["platform"],
+                url=item["url"],
+                metadata=item["metadata"],
+            )
+            for item in entry["posts"]
+        ]
+
+    def set(self, key: str, posts: List[Post]) -> None:
+        """Store posts under a key.
+
+        Args:
+            key: Cache key from make_key()
+            posts: Posts to cache
+        """
+        try:
+            entry = {
+                "stored_at": time.time(),
+                "posts": [
+                    {
+                        "id": post.id,
+                        "content": post.content,
+                        "created_at": post.created_at.isoformat(),
+                        "platform": post.platform,
+                        "url": post.url,
+                        "metadata": post.metadata,
+                    }
+                    for post in posts
+                ],
+            }
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_dir / f"{key}.json", "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+        except Exception as e:
+            logger.warning(f"Failed to cache posts for {key}: {e}")
+
+    def invalidate(self, platform_name: str) -> None:
+        """Drop every cached listing of a platform.
+
+        Args:
+            platform_name: Name of the platform
+        """
+        for filepath in self.cache_dir.glob(f"{platform_name}_*.json"):
+            try:
+                filepath.unlink()
+            except OSError as e:
+                logger.warning(f"Failed to remove cache entry {filepath}: {e}")
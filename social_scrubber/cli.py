@@ -1,31 +1,50 @@
 """Main CLI application for Social Scrubber."""
 
 import asyncio
+import importlib
+import logging
+import os
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import cached_property
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Type
 
 import click
 from rich.console import Console
+from rich.progress import Progress
 from rich.table import Table
 
 from . import __version__
-from .config import Config
+from .cache import PostCache
+from .config import Config, PlatformConfig
 from .platforms.base import BasePlatform
-from .platforms.bluesky import BlueskyPlatform
-from .platforms.mastodon import MastodonPlatform
-from .platforms.twitter import TwitterPlatform
 from .utils import (
     confirm_action,
     display_deletion_results,
     display_posts_table,
     ensure_archive_directory,
     format_date_range,
+    install_uvloop,
     print_banner,
     print_platform_status,
     setup_logging,
 )
 
 console = Console()
+logger = logging.getLogger(__name__)
+
+# Platform client classes by platform name. Their modules pull in the platform
+# SDKs, so they are only imported once a configured platform is used.
+_PLATFORM_CLASSES = {
+    "bluesky": (".platforms.bluesky", "BlueskyPlatform"),
+    "mastodon": (".platforms.mastodon", "MastodonPlatform"),
+    "twitter": (".platforms.twitter", "TwitterPlatform"),
+}
+
+
+def _load_platform_class(platform_name: str) -> Type[BasePlatform]:
+    """Import and return the client class of a platform."""
+    module_name, class_name = _PLATFORM_CLASSES[platform_name]
+    return getattr(importlib.import_module(module_name, __package__), class_name)
 
 
 class SocialScrubber:
@@ -36,11 +55,35 @@ class SocialScrubber:
         self.config = Config.from_env()
         setup_logging(self.config.log_level)
 
-        # Initialize platforms
-        self.platforms: Dict[str, BasePlatform] = {
-            "bluesky": BlueskyPlatform(self.config.bluesky),
-            "mastodon": MastodonPlatform(self.config.mastodon),
-            "twitter": TwitterPlatform(self.config.twitter),
+        self._platform_configs = {
+            "bluesky": self.config.bluesky,
+            "mastodon": self.config.mastodon,
+            "twitter": self.config.twitter,
+        }
+
+        self._display_titles = {
+            name: f"{name.title()} Posts" for name in self._platform_configs
+        }
+
+        # Result of creating the archive directory, once it has been attempted
+        self._archive_directory_ready: Optional[bool] = None
+        self._post_cache: Optional[PostCache] = None
+
+    @cached_property
+    def configured_platforms(self) -> Dict[str, PlatformConfig]:
+        """Configs of the platforms that have credentials, by platform name."""
+        return {
+            name: cfg
+            for name, cfg in self._platform_configs.items()
+            if cfg.is_configured
+        }
+
+    @cached_property
+    def platforms(self) -> Dict[str, BasePlatform]:
+        """Configured platform clients, constructed on first use."""
+        return {
+            name: _load_platform_class(name)(cfg)
+            for name, cfg in self.configured_platforms.items()
         }
 
     async def authenticate_platforms(
@@ -57,30 +100,46 @@ class SocialScrubber:
         """
         auth_results = {}
 
-        platforms_to_auth = (
-            selected_platforms if selected_platforms else list(self.platforms.keys())
-        )
+        platforms_to_auth = [
+            name
+            for name in (
+                selected_platforms
+                if selected_platforms
+                else list(self.platforms.keys())
+            )
+            if name in self.platforms
+        ]
 
         for platform_name in platforms_to_auth:
-            if platform_name not in self.platforms:
-                continue
-
             platform = self.platforms[platform_name]
             console.print(f"\n🔐 Authenticating with {platform.display_name}...")
 
-            success = await platform.authenticate()
-            auth_results[platform_name] = success
+        # Platforms are independent, so log in to all of them concurrently
+        results = await asyncio.gather(
+            *(self.platforms[name].authenticate() for name in platforms_to_auth),
+            return_exceptions=True,
+        )
+
+        for platform_name, result in zip(platforms_to_auth, results):
+            if isinstance(result, BaseException):
+                console.print(
+                    f"❌ Failed to authenticate with "
+                    f"{self.platforms[platform_name].display_name}: {result}"
+                )
+                auth_results[platform_name] = False
+            else:
+                auth_results[platform_name] = result
 
         return auth_results
 
-    async def get_posts_from_platforms(
+    async def iter_posts_from_platforms(
         self,
         platform_names: List[str],
         start_date: datetime,
         end_date: datetime,
         limit: Optional[int] = None,
-    ) -> Dict[str, List]:
-        """Get posts from specified platforms.
+    ) -> AsyncIterator[Tuple[str, List]]:
+        """Fetch posts from platforms concurrently, yielding each as it finishes.
 
         Args:
             platform_names: List of platform names
@@ -88,11 +147,25 @@ class SocialScrubber:
             end_date: End date for posts
             limit: Maximum posts per platform
 
-        Returns:
-            Dictionary mapping platform names to lists of posts
+        Yields:
+            Tuples of platform name and its posts, in completion order. A
+            platform whose fetch failed yields an empty list.
         """
-        all_posts = {}
 
+        async def _fetch(platform_name: str):
+            platform = self.platforms[platform_name]
+            try:
+                posts = await self._cached_get_posts(
+                    platform, start_date, end_date, limit
+                )
+            except Exception as e:
+                console.print(
+                    f"❌ Error fetching posts from {platform.display_name}: {e}"
+                )
+                return platform_name, None
+            return platform_name, posts
+
+        tasks = []
         for platform_name in platform_names:
             platform = self.platforms[platform_name]
 
@@ -101,30 +174,140 @@ class SocialScrubber:
                 continue
 
             console.print(f"📥 Fetching posts from {platform.display_name}...")
+            tasks.append(asyncio.create_task(_fetch(platform_name)))
 
-            try:
-                posts = await platform.get_posts(start_date, end_date, limit)
-                all_posts[platform_name] = posts
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                platform_name, posts = await next_done
+                if posts is None:
+                    yield platform_name, []
+                    continue
 
+                display_name = self.platforms[platform_name].display_name
                 if posts:
-                    console.print(
-                        f"✅ Found {len(posts)} posts from {platform.display_name}"
-                    )
+                    console.print(f"✅ Found {len(posts)} posts from {display_name}")
                 else:
                     console.print(
-                        f"ℹ️ No posts found from {platform.display_name} in date range"
+                        f"ℹ️ No posts found from {display_name} in date range"
                     )
+                yield platform_name, posts
+        finally:
+            # Don't leave fetches running if the caller stopped early
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
-            except Exception as e:
-                console.print(
-                    f"❌ Error fetching posts from {platform.display_name}: {e}"
-                )
-                all_posts[platform_name] = []
+    async def get_posts_from_platforms(
+        self,
+        platform_names: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        limit: Optional[int] = None,
+    ) -> Tuple[Dict[str, List], int]:
+        """Get posts from specified platforms.
+
+        Args:
+            platform_names: List of platform names
+            start_date: Start date for posts
+            end_date: End date for posts
+            limit: Maximum posts per platform
+
+        Returns:
+            Tuple of a dictionary mapping platform names to lists of posts and
+            the total number of posts found
+        """
+        all_posts = {}
+        total_posts = 0
+        async for platform_name, posts in self.iter_posts_from_platforms(
+            platform_names, start_date, end_date, limit
+        ):
+            all_posts[platform_name] = posts
+            total_posts += len(posts)
+
+        # Keep the caller's platform order regardless of completion order
+        ordered_posts = {
+            name: all_posts[name] for name in platform_names if name in all_posts
+        }
+        return ordered_posts, total_posts
+
+    def _get_post_cache(self) -> Optional[PostCache]:
+        """Get the post listing cache, or None if caching is disabled."""
+        ttl = self.config.scrub.post_cache_ttl
+        if ttl <= 0:
+            return None
+        if self._post_cache is None:
+            cache_dir = os.path.join(self.config.scrub.archive_path, ".cache")
+            self._post_cache = PostCache(cache_dir, ttl)
+        return self._post_cache
+
+    async def _cached_get_posts(
+        self,
+        platform: BasePlatform,
+        start_date: datetime,
+        end_date: datetime,
+        limit: Optional[int] = None,
+    ) -> List:
+        """Get posts from a platform, reusing a recent identical fetch.
+
+        Posts are read page by page through the platform's iter_posts(), which
+        raises on errors rather than returning no posts the way get_posts()
+        does, so a failed fetch is reported and never cached.
 
-        return all_posts
+        Args:
+            platform: Platform to fetch posts from
+            start_date: Start date for posts
+            end_date: End date for posts
+            limit: Maximum posts to fetch
+
+        Returns:
+            List of posts
+        """
+        cache = self._get_post_cache()
+        if cache is None:
+            return await self._collect_posts(platform, start_date, end_date, limit)
+
+        key = cache.make_key(
+            platform.name, platform.account, start_date, end_date, limit
+        )
+        posts = await asyncio.to_thread(cache.get, key)
+        if posts is not None:
+            logger.debug(f"Cache HIT for {platform.display_name} posts")
+            return posts
+
+        logger.debug(f"Cache MISS for {platform.display_name} posts")
+        posts = await self._collect_posts(platform, start_date, end_date, limit)
+        await asyncio.to_thread(cache.set, key, posts)
+        return posts
+
+    @staticmethod
+    async def _collect_posts(
+        platform: BasePlatform,
+        start_date: datetime,
+        end_date: datetime,
+        limit: Optional[int] = None,
+    ) -> List:
+        """Read every post a platform's iter_posts() yields into a list."""
+        return [post async for post in platform.iter_posts(start_date, end_date, limit)]
+
+    async def _prepare_archive_directory(self) -> bool:
+        """Create the archive directory off the event loop, at most once.
+
+        Returns:
+            True if the archive directory exists or was created successfully
+        """
+        if self._archive_directory_ready is None:
+            self._archive_directory_ready = await asyncio.to_thread(
+                ensure_archive_directory, self.config.scrub.archive_path
+            )
+        return self._archive_directory_ready
 
     async def delete_posts_from_platform(
-        self, platform_name: str, posts: List, dry_run: bool = True
+        self,
+        platform_name: str,
+        posts: List,
+        dry_run: bool = True,
+        progress: Optional[Progress] = None,
     ) -> List:
         """Delete posts from a specific platform.
 
@@ -132,6 +315,7 @@ class SocialScrubber:
             platform_name: Name of the platform
             posts: List of posts to delete
             dry_run: Whether to perform a dry run
+            progress: Optional progress display updated as each post finishes
 
         Returns:
             List of deletion results
@@ -151,19 +335,42 @@ class SocialScrubber:
 
         # Ensure archive directory exists if archiving is enabled
         if self.config.scrub.archive_before_delete:
-            if not ensure_archive_directory(self.config.scrub.archive_path):
+            if not await self._prepare_archive_directory():
                 console.print(
                     "❌ Failed to create archive directory. Aborting deletion."
                 )
                 return []
 
+        on_result = None
+        if progress is not None:
+            task_id = progress.add_task(
+                f"Deleting from {platform.display_name}", total=len(posts)
+            )
+            # Failures are listed in the summary, so per-post lines are debug-only
+            verbose = self.config.log_level.upper() == "DEBUG"
+
+            def report_result(result):
+                if verbose:
+                    status = "✓" if result.success else "✗"
+                    progress.console.print(f"{status} {result.post_id}")
+                progress.advance(task_id)
+
+            on_result = report_result
+
         # Perform bulk deletion
         results = await platform.bulk_delete_posts(
             posts,
             archive_before_delete=self.config.scrub.archive_before_delete,
             archive_path=self.config.scrub.archive_path,
+            max_concurrency=self.config.scrub.max_concurrent_deletes,
+            on_result=on_result,
         )
 
+        # Cached listings of this platform now include deleted posts
+        cache = self._get_post_cache()
+        if cache is not None and any(result.success for result in results):
+            await asyncio.to_thread(cache.invalidate, platform.name)
+
         return results
 
     async def archive_posts_from_platform(
@@ -174,7 +381,7 @@ class SocialScrubber:
         if not posts:
             return []
         # Ensure archive directory exists
-        if not ensure_archive_directory(self.config.scrub.archive_path):
+        if not await self._prepare_archive_directory():
             console.print("❌ Failed to create archive directory. Aborting archive.")
             return []
         results = []
@@ -210,8 +417,7 @@ class SocialScrubber:
         table.add_column("Status", style="green")
         table.add_column("Configuration")
 
-        for platform_name, platform in self.platforms.items():
-            config_attr = getattr(self.config, platform_name)
+        for platform_name, config_attr in self._platform_configs.items():
             status = (
                 "✅ Configured" if config_attr.is_configured else "❌ Not Configured"
             )
@@ -242,6 +448,9 @@ class SocialScrubber:
         scrub_table.add_row(
             "Max Posts Per Scrub", str(self.config.scrub.max_posts_per_scrub)
         )
+        scrub_table.add_row(
+            "Max Concurrent Deletes", str(self.config.scrub.max_concurrent_deletes)
+        )
         scrub_table.add_row("Start Date", self.config.scrub.start_date)
         scrub_table.add_row("End Date", self.config.scrub.end_date)
         scrub_table.add_row(
@@ -259,9 +468,7 @@ class SocialScrubber:
 
         # Get configured platforms
         configured_platforms = [
-            name
-            for name, platform in self.platforms.items()
-            if getattr(self.config, name).is_configured
+            name for name in self.configured_platforms if name in self.platforms
         ]
 
         if not configured_platforms:
@@ -270,29 +477,31 @@ class SocialScrubber:
             )
             return
 
-        results = {}
         for platform_name in configured_platforms:
-            platform = self.platforms[platform_name]
-            console.print(f"Testing {platform.display_name}...")
+            console.print(f"Testing {self.platforms[platform_name].display_name}...")
 
-            try:
-                success = await platform.authenticate()
-                if success:
-                    console.print(f"✅ {platform.display_name}: Connection successful")
-                    results[platform_name] = True
-                else:
-                    console.print(f"❌ {platform.display_name}: Authentication failed")
-                    results[platform_name] = False
-            except Exception as e:
+        # Test every platform at once so a slow handshake doesn't delay the rest
+        outcomes = await asyncio.gather(
+            *(self.platforms[name].authenticate() for name in configured_platforms),
+            return_exceptions=True,
+        )
+
+        successful = 0
+        for platform_name, outcome in zip(configured_platforms, outcomes):
+            platform = self.platforms[platform_name]
+            if isinstance(outcome, Exception):
                 console.print(
-                    f"❌ {platform.display_name}: Connection error - {str(e)}"
+                    f"❌ {platform.display_name}: Connection error - {str(outcome)}"
                 )
-                results[platform_name] = False
+            elif outcome:
+                console.print(f"✅ {platform.display_name}: Connection successful")
+                successful += 1
+            else:
+                console.print(f"❌ {platform.display_name}: Authentication failed")
 
         # Summary
         console.print("\n[bold]📊 Test Summary[/bold]")
-        successful = sum(1 for success in results.values() if success)
-        total = len(results)
+        total = len(configured_platforms)
         console.print(f"✅ Successful connections: {successful}/{total}")
 
         if successful == total:
@@ -304,6 +513,23 @@ class SocialScrubber:
         else:
             console.print("[red]❌ No platforms are connecting properly[/red]")
 
+    async def close(self):
+        """Close the HTTP sessions held by every platform."""
+        # Only platforms that were actually constructed have anything to close
+        platforms = self.__dict__.get("platforms", {})
+        await asyncio.gather(
+            *(platform.close() for platform in platforms.values()),
+            return_exceptions=True,
+        )
+
+    async def __aenter__(self) -> "SocialScrubber":
+        """Use the scrubber as an async context manager that closes on exit."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the HTTP sessions held by every platform."""
+        await self.close()
+
     async def run_interactive(self, selected_platforms: Optional[List[str]] = None):
         """Run the interactive mode with optional platform filtering.
 
@@ -315,19 +541,17 @@ class SocialScrubber:
 
         console.print("🔧 Checking platform configurations...")
 
-        # Display platform status
-        for platform_name, platform in self.platforms.items():
-            config_attr = getattr(self.config, platform_name)
+        # Display platform status and collect the configured platforms
+        all_configured_platforms = []
+        for platform_name, config_attr in self._platform_configs.items():
+            platform = self.platforms.get(platform_name)
             print_platform_status(
-                platform_name, config_attr.is_configured, platform.is_authenticated
+                platform_name,
+                config_attr.is_configured,
+                platform is not None and platform.is_authenticated,
             )
-
-        # Get configured platforms, filtered by selection if provided
-        all_configured_platforms = [
-            name
-            for name, platform in self.platforms.items()
-            if getattr(self.config, name).is_configured
-        ]
+            if config_attr.is_configured and platform is not None:
+                all_configured_platforms.append(platform_name)
 
         if not all_configured_platforms:
             console.print(
@@ -363,7 +587,17 @@ class SocialScrubber:
         console.print(
             f"\n🔐 Authenticating with {len(configured_platforms)} platform(s)..."
         )
-        auth_results = await self.authenticate_platforms(configured_platforms)
+        needs_archive = (
+            not self.config.scrub.dry_run and self.config.scrub.archive_before_delete
+        )
+        if needs_archive:
+            # Prepare the archive directory while the logins are in flight
+            auth_results, _ = await asyncio.gather(
+                self.authenticate_platforms(configured_platforms),
+                self._prepare_archive_directory(),
+            )
+        else:
+            auth_results = await self.authenticate_platforms(configured_platforms)
 
         authenticated_platforms = [
             name for name, success in auth_results.items() if success
@@ -397,24 +631,35 @@ class SocialScrubber:
             console.print("Operation cancelled.")
             return
 
-        # Fetch posts from all authenticated platforms
-        all_posts = await self.get_posts_from_platforms(
+        # Fetch posts from all authenticated platforms, showing each platform's
+        # posts as soon as they arrive rather than after the slowest platform
+        fetched_posts = {}
+        total_posts = 0
+        async for platform_name, posts in self.iter_posts_from_platforms(
             authenticated_platforms,
             start_date,
             end_date,
             self.config.scrub.max_posts_per_scrub,
-        )
+        ):
+            fetched_posts[platform_name] = posts
+            total_posts += len(posts)
+            if posts:
+                display_posts_table(posts, self._display_titles[platform_name])
 
-        # Display posts found
-        total_posts = sum(len(posts) for posts in all_posts.values())
         if total_posts == 0:
             console.print("\n✅ No posts found in the specified date range.")
             return
 
-        console.print(f"\n📊 Found {total_posts} posts total:")
-        for platform_name, posts in all_posts.items():
-            if posts:
-                display_posts_table(posts, f"{platform_name.title()} Posts")
+        console.print(f"\n📊 Found {total_posts} posts total")
+        all_posts = {
+            name: fetched_posts[name]
+            for name in authenticated_platforms
+            if name in fetched_posts
+        }
+
+        if needs_archive and not await self._prepare_archive_directory():
+            console.print("\n❌ Failed to create archive directory. Aborting deletion.")
+            return
 
         # Confirm deletion
         if self.config.scrub.dry_run:
@@ -430,21 +675,48 @@ class SocialScrubber:
                 console.print("Deletion cancelled.")
                 return
 
-        # Delete posts from each platform
-        for platform_name, posts in all_posts.items():
-            if not posts:
-                continue
-
-            results = await self.delete_posts_from_platform(
-                platform_name, posts, dry_run=self.config.scrub.dry_run
+        # Delete posts from all platforms concurrently, sharing one progress display
+        with Progress(console=console, disable=self.config.scrub.dry_run) as progress:
+            delete_tasks = {
+                platform_name: asyncio.create_task(
+                    self.delete_posts_from_platform(
+                        platform_name,
+                        posts,
+                        dry_run=self.config.scrub.dry_run,
+                        progress=progress,
+                    )
+                )
+                for platform_name, posts in all_posts.items()
+                if posts
+            }
+            results_map = dict(
+                zip(
+                    delete_tasks.keys(),
+                    await asyncio.gather(
+                        *delete_tasks.values(), return_exceptions=True
+                    ),
+                )
             )
 
-            if results:
+        for platform_name in all_posts:
+            results = results_map.get(platform_name)
+            if isinstance(results, BaseException):
+                console.print(
+                    f"❌ Error deleting posts from "
+                    f"{self.platforms[platform_name].display_name}: {results}"
+                )
+            elif results:
                 display_deletion_results(results, platform_name)
 
         console.print("\n✅ Social Scrubber completed!")
 
 
+async def _run_and_close(scrubber: SocialScrubber, coro):
+    """Await a scrubber coroutine, then release the platforms' HTTP sessions."""
+    async with scrubber:
+        return await coro
+
+
 # CLI Command Group
 
 
@@ -525,7 +797,7 @@ def scrub(ctx, dry_run, max_posts, platforms, start_date, end_date):
         selected_platforms = [p.strip() for p in platforms.split(",")]
 
     # Run the interactive scrubber
-    asyncio.run(scrubber.run_interactive(selected_platforms))
+    asyncio.run(_run_and_close(scrubber, scrubber.run_interactive(selected_platforms)))
 
 
 @cli.command()
@@ -553,7 +825,7 @@ def test(ctx):
         scrubber.config.log_level = ctx.obj["log_level"]
         setup_logging(scrubber.config.log_level)
 
-    asyncio.run(scrubber.test_connections())
+    asyncio.run(_run_and_close(scrubber, scrubber.test_connections()))
 
 
 @cli.command()
@@ -595,22 +867,22 @@ def archive(ctx, max_posts, platforms, start_date, end_date):
     if platforms:
         selected_platforms = [p.strip() for p in platforms.split(",")]
     # Authenticate platforms
-    asyncio.run(_run_archive(scrubber, selected_platforms))
+    asyncio.run(_run_and_close(scrubber, _run_archive(scrubber, selected_platforms)))
 
 
 async def _run_archive(scrubber, selected_platforms):
     print_banner()
     console.print("🔧 Checking platform configurations...")
-    for platform_name, platform in scrubber.platforms.items():
-        config_attr = getattr(scrubber.config, platform_name)
+    all_configured_platforms = []
+    for platform_name, config_attr in scrubber._platform_configs.items():
+        platform = scrubber.platforms.get(platform_name)
         print_platform_status(
-            platform_name, config_attr.is_configured, platform.is_authenticated
+            platform_name,
+            config_attr.is_configured,
+            platform is not None and platform.is_authenticated,
         )
-    all_configured_platforms = [
-        name
-        for name, platform in scrubber.platforms.items()
-        if getattr(scrubber.config, name).is_configured
-    ]
+        if config_attr.is_configured and platform is not None:
+            all_configured_platforms.append(platform_name)
     if not all_configured_platforms:
         console.print("\n❌ No platforms are configured. Please check your .env file.")
         return
@@ -651,20 +923,20 @@ async def _run_archive(scrubber, selected_platforms):
     if not confirm_action("Proceed with fetching posts to archive?", default=True):
         console.print("Operation cancelled.")
         return
-    all_posts = await scrubber.get_posts_from_platforms(
+    all_posts, total_posts = await scrubber.get_posts_from_platforms(
         authenticated_platforms,
         start_date,
         end_date,
         scrubber.config.scrub.max_posts_per_scrub,
     )
-    total_posts = sum(len(posts) for posts in all_posts.values())
     if total_posts == 0:
         console.print("\n✅ No posts found in the specified date range.")
         return
     console.print(f"\n📊 Found {total_posts} posts total:")
-    for platform_name, posts in all_posts.items():
-        if posts:
-            display_posts_table(posts, f"{platform_name.title()} Posts")
+    # The table has a platform column, so every post fits in a single render
+    display_posts_table(
+        [post for posts in all_posts.values() for post in posts], "All Posts"
+    )
     if not confirm_action(f"Archive {total_posts} posts?", default=True):
         console.print("Archiving cancelled.")
         return
@@ -673,7 +945,8 @@ async def _run_archive(scrubber, selected_platforms):
             continue
         results = await scrubber.archive_posts_from_platform(platform_name, posts)
         if results:
-            console.print(f"\n📦 Archived posts from {platform_name.title()}:")
+            display_name = scrubber.platforms[platform_name].display_name
+            console.print(f"\n📦 Archived posts from {display_name}:")
             for r in results:
                 status = "✅" if r["archived"] else "❌"
                 console.print(f"{status} {r['post_id']} -> {r['archive_path']}")
@@ -685,6 +958,9 @@ def main():
     """Main entry point."""
     import sys
 
+    # Use the faster uvloop event loop for every command when it's available
+    install_uvloop()
+
     # If no arguments provided, just run the CLI group (will show help)
     if len(sys.argv) == 1:
         cli()
@@ -1,51 +1,80 @@
 """Configuration management for Social Scrubber."""
 
 import os
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta, timezone
+from functools import cached_property, lru_cache
+from typing import Callable, Dict, Optional, Tuple, Union
 
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
 
-# Load environment variables
-load_dotenv()
+from .dates import to_utc
 
+_UTC = timezone.utc
 
-class BlueskyConfig(BaseModel):
+
+def _local_midnight(now: datetime) -> datetime:
+    """Return the start of the user's local day containing now, in UTC."""
+    midnight = datetime.combine(now.astimezone().date(), time.min)
+    # A naive datetime's astimezone() applies the local offset in effect that
+    # day, so DST changes between midnight and now are accounted for
+    return to_utc(midnight.astimezone())
+
+
+# Relative date keywords, resolved against the time of the first lookup
+_SPECIAL_START_DATES: Dict[str, Callable[[datetime], datetime]] = {
+    "7_days_ago": lambda now: now - timedelta(days=7),
+    "today": _local_midnight,
+}
+_SPECIAL_END_DATES: Dict[str, Callable[[datetime], datetime]] = {
+    "today": lambda now: now,
+}
+
+
+@lru_cache(maxsize=1)
+def _load_dotenv() -> None:
+    """Load the .env file into the environment, once per process."""
+    load_dotenv()
+
+
+@dataclass(frozen=True)
+class BlueskyConfig:
     """Bluesky configuration."""
 
-    handle: str = Field(default="", description="Bluesky handle")
-    password: str = Field(default="", description="Bluesky app password")
+    handle: str = ""  # Bluesky handle
+    password: str = ""  # Bluesky app password
 
-    @property
+    # Credentials never change after loading, so is_configured can be cached
+    @cached_property
     def is_configured(self) -> bool:
         """Check if Bluesky is properly configured."""
         return bool(self.handle and self.password)
 
 
-class MastodonConfig(BaseModel):
+@dataclass(frozen=True)
+class MastodonConfig:
     """Mastodon configuration."""
 
-    api_base_url: str = Field(default="", description="Mastodon instance URL")
-    access_token: str = Field(default="", description="Mastodon access token")
+    api_base_url: str = ""  # Mastodon instance URL
+    access_token: str = ""  # Mastodon access token
 
-    @property
+    @cached_property
     def is_configured(self) -> bool:
         """Check if Mastodon is properly configured."""
         return bool(self.api_base_url and self.access_token)
 
 
-class TwitterConfig(BaseModel):
+@dataclass(frozen=True)
+class TwitterConfig:
     """Twitter/X configuration."""
 
-    api_key: str = Field(default="", description="Twitter API key")
-    api_secret: str = Field(default="", description="Twitter API secret")
-    access_token: str = Field(default="", description="Twitter access token")
-    access_token_secret: str = Field(
-        default="", description="Twitter access token secret"
-    )
-    bearer_token: str = Field(default="", description="Twitter bearer token")
+    api_key: str = ""  # Twitter API key
+    api_secret: str = ""  # Twitter API secret
+    access_token: str = ""  # Twitter access token
+    access_token_secret: str = ""  # Twitter access token secret
+    bearer_token: str = ""  # Twitter bearer token
 
-    @property
+    @cached_property
     def is_configured(self) -> bool:
         """Check if Twitter is properly configured."""
         return bool(
@@ -56,61 +85,87 @@ class TwitterConfig(BaseModel):
         )
 
 
-class ScrubConfig(BaseModel):
+PlatformConfig = Union[BlueskyConfig, MastodonConfig, TwitterConfig]
+
+
+@dataclass
+class ScrubConfig:
     """Scrubbing configuration."""
 
-    start_date: str = Field(
-        default="7_days_ago", description="Start date for scrubbing"
-    )
-    end_date: str = Field(default="today", description="End date for scrubbing")
-    max_posts_per_scrub: int = Field(
-        default=10, description="Maximum posts to scrub per run"
-    )
-    dry_run: bool = Field(default=True, description="Whether to run in dry-run mode")
-    archive_before_delete: bool = Field(
-        default=True, description="Archive posts before deletion"
-    )
-    archive_path: str = Field(
-        default="./archives", description="Path to store archives"
+    start_date: str = "7_days_ago"  # Start date for scrubbing
+    end_date: str = "today"  # End date for scrubbing
+    max_posts_per_scrub: int = 10  # Maximum posts to scrub per run
+    max_concurrent_deletes: int = 8  # Maximum delete requests in flight per platform
+    dry_run: bool = True  # Whether to run in dry-run mode
+    archive_before_delete: bool = True  # Archive posts before deletion
+    archive_path: str = "./archives"  # Path to store archives
+    post_cache_ttl: int = 0  # Seconds to cache post listings (0 disables caching)
+
+    # Single "now" shared by both bounds, and dates already parsed
+    _now: Optional[datetime] = field(default=None, init=False, repr=False)
+    _parsed_dates: Dict[Tuple[str, str], datetime] = field(
+        default_factory=dict, init=False, repr=False
     )
 
     def get_start_datetime(self) -> datetime:
-        """Parse start date into datetime object."""
-        if self.start_date == "7_days_ago":
-            return datetime.now() - timedelta(days=7)
-        elif self.start_date == "today":
-            return datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        else:
-            # Try to parse as ISO format
-            try:
-                return datetime.fromisoformat(self.start_date)
-            except ValueError:
-                raise ValueError(f"Invalid start date format: {self.start_date}")
+        """Parse start date into a UTC-aware datetime object."""
+        return self._parse_date("start", self.start_date, _SPECIAL_START_DATES)
 
     def get_end_datetime(self) -> datetime:
-        """Parse end date into datetime object."""
-        if self.end_date == "today":
-            return datetime.now()
+        """Parse end date into a UTC-aware datetime object."""
+        return self._parse_date("end", self.end_date, _SPECIAL_END_DATES)
+
+    def _parse_date(
+        self,
+        bound: str,
+        value: str,
+        special_dates: Dict[str, Callable[[datetime], datetime]],
+    ) -> datetime:
+        """Parse a date setting once and reuse the result.
+
+        Args:
+            bound: Which bound is being parsed ("start" or "end")
+            value: Configured date string
+            special_dates: Relative date keywords accepted for this bound
+
+        Returns:
+            UTC-aware datetime
+        """
+        key = (bound, value)
+        parsed = self._parsed_dates.get(key)
+        if parsed is not None:
+            return parsed
+
+        resolve = special_dates.get(value)
+        if resolve is not None:
+            if self._now is None:
+                self._now = datetime.now(_UTC)
+            parsed = resolve(self._now)
         else:
             # Try to parse as ISO format
             try:
-                return datetime.fromisoformat(self.end_date)
+                parsed = to_utc(datetime.fromisoformat(value))
             except ValueError:
-                raise ValueError(f"Invalid end date format: {self.end_date}")
+                raise ValueError(f"Invalid {bound} date format: {value}")
+
+        self._parsed_dates[key] = parsed
+        return parsed
 
 
-class Config(BaseModel):
+@dataclass
+class Config:
     """Main configuration class."""
 
     bluesky: BlueskyConfig
     mastodon: MastodonConfig
     twitter: TwitterConfig
     scrub: ScrubConfig
-    log_level: str = Field(default="INFO", description="Logging level")
+    log_level: str = "INFO"  # Logging level
 
     @classmethod
     def from_env(cls) -> "Config":
         """Create configuration from environment variables."""
+        _load_dotenv()
         return cls(
             bluesky=BlueskyConfig(
                 handle=os.getenv("BLUESKY_HANDLE", ""),
@@ -131,10 +186,12 @@ class Config(BaseModel):
                 start_date=os.getenv("SCRUB_START_DATE", "7_days_ago"),
                 end_date=os.getenv("SCRUB_END_DATE", "today"),
                 max_posts_per_scrub=int(os.getenv("MAX_POSTS_PER_SCRUB", "10")),
+                max_concurrent_deletes=int(os.getenv("MAX_CONCURRENT_DELETES", "8")),
                 dry_run=os.getenv("DRY_RUN", "true").lower() == "true",
                 archive_before_delete=os.getenv("ARCHIVE_BEFORE_DELETE", "true").lower()
                 == "true",
                 archive_path=os.getenv("ARCHIVE_PATH", "./archives"),
+                post_cache_ttl=int(os.getenv("POST_CACHE_TTL", "0")),
             ),
             log_level=os.getenv("LOG_LEVEL", "INFO"),
         )
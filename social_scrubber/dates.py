@@ -0,0 +1,21 @@
+"""Date helpers shared by the configuration and the platforms."""
+
+from datetime import datetime, timezone
+
+
+def to_utc(value: datetime) -> datetime:
+    """Convert a datetime to aware UTC, the form post dates are compared in.
+
+    Values already in UTC, as parsed from API timestamps, are returned as-is.
+
+    Args:
+        value: Datetime to convert; naive values are assumed to be UTC already
+
+    Returns:
+        Datetime with its tzinfo set to UTC
+    """
+    if value.tzinfo is timezone.utc:
+        return value
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
@@ -0,0 +1,69 @@
+"""Append-only JSONL archive files for deleted posts."""
+
+import json
+import threading
+from pathlib import Path
+from typing import IO, Any, Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+
+def _dumps_line(record: Dict[str, Any]) -> bytes:
+    """Serialize a record as one compact UTF-8 JSON line.
+
+    Uses orjson when it is installed; both encoders emit no extra whitespace.
+
+    Args:
+        record: JSON-serializable data
+
+    Returns:
+        Encoded JSON followed by a newline
+    """
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+    return (line + "\n").encode("utf-8")
+
+
+class ArchiveWriter:
+    """Appends archive records to a single JSONL file.
+
+    The file is opened on the first write and kept open until close(). Writes
+    may come from several worker threads at once, so each append is done
+    under a lock and flushed before returning, ensuring a post is on disk
+    before it gets deleted.
+    """
+
+    def __init__(self, filepath: Path):
+        """Initialize the writer.
+
+        Args:
+            filepath: JSONL file to append to
+        """
+        self.filepath = filepath
+        self._file: Optional[IO[bytes]] = None
+        self._lock = threading.Lock()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Append a record as one line.
+
+        Args:
+            record: JSON-serializable data
+        """
+        line = _dumps_line(record)
+        with self._lock:
+            if self._file is None:
+                self.filepath.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.filepath, "ab")
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        """Close the underlying file, if it was opened."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,54 @@
+"""Client-side rate limiting for platform API calls."""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class AsyncTokenBucket:
+    """Token bucket that paces coroutines to a steady request rate.
+
+    Up to ``burst`` requests may go out back to back; after that callers wait
+    until enough time has passed to refill a token at ``rate`` per second.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens the bucket holds
+        """
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        # Created on first use so the lock binds to the running event loop
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self, tokens: int = 1) -> None:
+        """Wait until tokens are available and take them.
+
+        Args:
+            tokens: Number of tokens to take; more than the burst are taken
+                one at a time as they refill
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        remaining = max(1, tokens)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+
+                taken = min(remaining, int(self._tokens))
+                self._tokens -= taken
+                remaining -= taken
+                if not remaining:
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
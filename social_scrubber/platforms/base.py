@@ -1,14 +1,56 @@
 """Base platform interface for social media platforms."""
 
-import json
+import asyncio
+import logging
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, TypeVar
 
+from dateutil import parser as date_parser
 
-@dataclass
+from ._archive import ArchiveWriter
+from ._ratelimit import AsyncTokenBucket
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Default number of delete requests allowed in flight per platform
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Default number of times a rate-limited API call is retried
+DEFAULT_MAX_RETRIES = 5
+
+# Posts are created by the thousand, so drop their per-instance __dict__ where
+# dataclasses support it (Python 3.10+)
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp as sent by the platform APIs.
+
+    Uses the C-implemented datetime.fromisoformat() and only falls back to
+    dateutil for forms it doesn't accept (before Python 3.11 that includes
+    fractions of a second with other than 3 or 6 digits).
+
+    Args:
+        value: ISO 8601 timestamp, optionally ending in "Z"
+
+    Returns:
+        Parsed datetime
+    """
+    try:
+        if value.endswith("Z"):
+            return datetime.fromisoformat(value[:-1] + "+00:00")
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return date_parser.isoparse(value)
+
+
+@dataclass(**_SLOTS)
 class Post:
     """Represents a social media post."""
 
@@ -28,7 +70,7 @@ class Post:
         return f"[{self.platform}] {date_str}: {preview}"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DeletionResult:
     """Result of a post deletion operation."""
 
@@ -42,14 +84,27 @@ class DeletionResult:
 class BasePlatform(ABC):
     """Base class for social media platform implementations."""
 
-    def __init__(self, name: str):
+    # Number of posts handed to delete_posts() at once by bulk_delete_posts()
+    delete_batch_size = 1
+
+    def __init__(self, name: str, rate_per_sec: Optional[float] = None, burst: int = 1):
         """Initialize the platform.
 
         Args:
             name: Name of the platform (e.g., "bluesky", "mastodon", "twitter")
+            rate_per_sec: Sustained API requests per second, or None to not pace
+            burst: Number of API requests allowed back to back
         """
         self.name = name
+        # Display name of the platform (e.g., "Bluesky"), used in every message
+        self.display_name = name.title()
         self._authenticated = False
+        # Archives from one run go to a single file per archive directory
+        self._run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._archive_writers: Dict[str, ArchiveWriter] = {}
+        self._rate_limiter: Optional[AsyncTokenBucket] = (
+            AsyncTokenBucket(rate_per_sec, burst) if rate_per_sec else None
+        )
 
     @abstractmethod
     async def authenticate(self) -> bool:
@@ -76,6 +131,26 @@ class BasePlatform(ABC):
         """
         pass
 
+    async def iter_posts(
+        self, start_date: datetime, end_date: datetime, limit: Optional[int] = None
+    ) -> AsyncIterator[Post]:
+        """Yield posts within the date range as they are retrieved.
+
+        Platforms that page through their API override this to hand out each
+        page as it arrives, so callers can stop early without fetching the
+        rest. The default just walks the list from get_posts().
+
+        Args:
+            start_date: Start date for posts to retrieve
+            end_date: End date for posts to retrieve
+            limit: Maximum number of posts to retrieve
+
+        Yields:
+            Post objects
+        """
+        for post in await self.get_posts(start_date, end_date, limit):
+            yield post
+
     @abstractmethod
     async def delete_post(self, post_id: str) -> DeletionResult:
         """Delete a specific post.
@@ -88,93 +163,263 @@ class BasePlatform(ABC):
         """
         pass
 
+    async def delete_posts(self, post_ids: List[str]) -> List[DeletionResult]:
+        """Delete several posts, one request per post.
+
+        Platforms with a batch delete endpoint override this, together with
+        ``delete_batch_size``, to delete the posts in fewer requests.
+
+        Args:
+            post_ids: IDs of the posts to delete
+
+        Returns:
+            DeletionResult objects, in the same order as ``post_ids``
+        """
+        results = []
+        for post_id in post_ids:
+            try:
+                results.append(await self.delete_post(post_id))
+            except Exception as e:
+                results.append(
+                    DeletionResult(post_id=post_id, success=False, error=str(e))
+                )
+        return results
+
+    def _retry_after(self, error: Exception) -> Optional[float]:
+        """Tell whether an API error is a rate limit, and how long to wait.
+
+        Subclasses override this to recognize their SDK's rate limit errors.
+
+        Args:
+            error: Exception raised by an API call
+
+        Returns:
+            None if the error is not a rate limit, otherwise the number of
+            seconds to wait before retrying (0 to use exponential backoff)
+        """
+        return None
+
+    async def _call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Call a platform API function, pacing and retrying on rate limits.
+
+        The SDKs are synchronous, so the call runs on a worker thread and the
+        event loop stays free for other requests in the meantime.
+
+        Args:
+            func: SDK function that issues the request
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            Whatever ``func`` returns
+        """
+        return await self._call_with_cost(1, func, *args, **kwargs)
+
+    async def _call_with_cost(
+        self, cost: int, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """Call a platform API function that counts as several requests.
+
+        Like _call(), but each attempt takes ``cost`` tokens from the rate
+        limiter, for requests the platform bills per item, such as batches.
+
+        Args:
+            cost: Number of requests the call is billed as
+            func: SDK function that issues the request
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            Whatever ``func`` returns
+        """
+        attempt = 0
+        while True:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire(cost)
+
+            try:
+                return await asyncio.to_thread(func, *args, **kwargs)
+            except Exception as e:
+                delay = self._retry_after(e)
+                if delay is None or attempt >= DEFAULT_MAX_RETRIES:
+                    raise
+
+                if delay <= 0:
+                    delay = 2**attempt
+                logger.warning(
+                    f"{self.display_name} rate limit reached, retrying in {delay:.0f}s"
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def __aenter__(self) -> "BasePlatform":
+        """Use the platform as an async context manager that closes on exit."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the platform's HTTP session and archive files."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Release any network resources held by the platform client.
+
+        Platforms keep a single pooled HTTP session for their whole lifetime so
+        that every request after login reuses the same keep-alive connections.
+        Subclasses that own such a session should override this to close it,
+        and call the base implementation to close open archive files.
+        """
+        writers = list(self._archive_writers.values())
+        self._archive_writers.clear()
+        for writer in writers:
+            await asyncio.to_thread(writer.close)
+
     async def bulk_delete_posts(
         self,
         posts: List[Post],
         archive_before_delete: bool = True,
         archive_path: str = "./archives",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        on_result: Optional[Callable[[DeletionResult], None]] = None,
     ) -> List[DeletionResult]:
         """Delete multiple posts.
 
+        Posts are fed through a bounded queue to a pool of ``max_concurrency``
+        workers, so at most that many requests are in flight against the
+        platform and only a small window of posts is queued at any time.
+        Each worker hands up to ``delete_batch_size`` posts at a time to
+        delete_posts().
+
         Args:
             posts: List of posts to delete
             archive_before_delete: Whether to archive posts before deletion
             archive_path: Path to store archived posts
+            max_concurrency: Maximum number of delete requests at the same time
+            on_result: Optional callback invoked with each result as soon as
+                that post is done, in completion order
 
         Returns:
-            List of DeletionResult objects
+            List of DeletionResult objects, in the same order as ``posts``
         """
-        results = []
-
-        for post in posts:
-            # Archive if requested
-            if archive_before_delete:
-                archive_file = await self._archive_post(post, archive_path)
-            else:
-                archive_file = None
-
-            # Delete the post
-            result = await self.delete_post(post.id)
-
-            # Update result with archive info
-            if archive_file:
-                result.archived = True
-                result.archive_path = archive_file
-
-            results.append(result)
+        results: List[Optional[DeletionResult]] = [None] * len(posts)
+        if not posts:
+            return []
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_concurrency * 2)
+        batch_size = max(1, self.delete_batch_size)
+
+        async def _delete_batch(batch: List[Post]) -> List[DeletionResult]:
+            try:
+                # Archive if requested
+                if archive_before_delete:
+                    archive_files = [
+                        await self._archive_post(post, archive_path) for post in batch
+                    ]
+                else:
+                    archive_files = [None] * len(batch)
+
+                # Delete the posts
+                batch_results = await self.delete_posts([post.id for post in batch])
+            except Exception as e:
+                return [
+                    DeletionResult(post_id=post.id, success=False, error=str(e))
+                    for post in batch
+                ]
+
+            # Update results with archive info
+            for result, archive_file in zip(batch_results, archive_files):
+                if archive_file:
+                    result.archived = True
+                    result.archive_path = archive_file
+
+            return batch_results
+
+        async def _produce(worker_count: int) -> None:
+            for start in range(0, len(posts), batch_size):
+                await queue.put((start, posts[start : start + batch_size]))
+            # One sentinel per worker tells it there is nothing left to do
+            for _ in range(worker_count):
+                await queue.put(None)
+
+        async def _consume() -> None:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                start, batch = item
+                batch_results = await _delete_batch(batch)
+                results[start : start + len(batch)] = batch_results
+                # Report each post as soon as it finishes rather than at the end
+                if on_result:
+                    for result in batch_results:
+                        on_result(result)
+
+        batch_count = -(-len(posts) // batch_size)
+        worker_count = min(max_concurrency, batch_count)
+        tasks = [asyncio.ensure_future(_produce(worker_count))]
+        tasks.extend(asyncio.ensure_future(_consume()) for _ in range(worker_count))
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
 
         return results
 
     async def _archive_post(self, post: Post, archive_path: str) -> Optional[str]:
         """Archive a post to local storage.
 
+        Posts are appended to one JSONL file per platform and run, written on
+        a worker thread so that disk I/O doesn't hold up the deletions running
+        concurrently on the event loop.
+
         Args:
             post: Post to archive
             archive_path: Path to store the archive
 
         Returns:
-            Path to the archived file, or None if archiving failed
+            Path to the archive file, or None if archiving failed
         """
-        try:
-            # Create archive directory if it doesn't exist
-            Path(archive_path).mkdir(parents=True, exist_ok=True)
-
-            # Create filename with timestamp and post ID
-            timestamp = post.created_at.strftime("%Y%m%d_%H%M%S")
-            # Sanitize post ID for filename use (replace invalid chars with underscores)
-            safe_post_id = "".join(
-                c if c.isalnum() or c in ".-_" else "_" for c in post.id
-            )
-            filename = f"{self.name}_{timestamp}_{safe_post_id}.json"
-            filepath = Path(archive_path) / filename
-
-            # Create archive data
-            archive_data = {
-                "platform": self.name,
-                "post_id": post.id,
-                "content": post.content,
-                "created_at": post.created_at.isoformat(),
-                "url": post.url,
-                "metadata": post.metadata,
-                "archived_at": datetime.now().isoformat(),
-            }
-
-            # Write to file
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(archive_data, f, indent=2, ensure_ascii=False)
-
-            return str(filepath)
+        # Create archive record
+        archive_data = {
+            "platform": self.name,
+            "post_id": post.id,
+            "content": post.content,
+            "created_at": post.created_at.isoformat(),
+            "url": post.url,
+            "metadata": post.metadata,
+            "archived_at": datetime.now(timezone.utc).isoformat(),
+        }
 
+        try:
+            writer = self._get_archive_writer(archive_path)
+            await asyncio.to_thread(writer.write, archive_data)
+            return str(writer.filepath)
         except Exception as e:
             print(f"Warning: Failed to archive post {post.id}: {e}")
             return None
 
+    def _get_archive_writer(self, archive_path: str) -> ArchiveWriter:
+        """Get this run's archive file writer for an archive directory.
+
+        Args:
+            archive_path: Path to store the archive
+
+        Returns:
+            Writer appending to ``<platform>_<run timestamp>.jsonl``
+        """
+        writer = self._archive_writers.get(archive_path)
+        if writer is None:
+            filename = f"{self.name}_{self._run_timestamp}.jsonl"
+            writer = ArchiveWriter(Path(archive_path) / filename)
+            self._archive_writers[archive_path] = writer
+        return writer
+
     @property
     def is_authenticated(self) -> bool:
         """Check if the platform is authenticated."""
         return self._authenticated
 
     @property
-    def display_name(self) -> str:
-        """Get the display name of the platform."""
-        return self.name.title()
+    def account(self) -> str:
+        """Identify the configured account, e.g. to keep cached data apart."""
+        return ""
@@ -1,25 +1,72 @@
 """Bluesky platform implementation."""
 
-from datetime import datetime
-from typing import List, Optional
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Optional, Tuple
 
-from atproto import Client
-from dateutil import parser as date_parser
+from atproto import Client, models
+from atproto_client.exceptions import BadRequestError, RequestException
+
+try:
+    from atproto_client.exceptions import RateLimitExceededError
+except ImportError:  # atproto < 0.0.72 raises a 429 as a plain RequestException
+    RateLimitExceededError = None
 
 from ..config import BlueskyConfig
-from .base import BasePlatform, DeletionResult, Post
+from ..dates import to_utc
+from .base import (
+    BasePlatform,
+    DeletionResult,
+    Post,
+    parse_iso_datetime,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bluesky allows 3000 API requests per 5 minutes per account
+RATE_PER_SECOND = 3000 / 300
+RATE_BURST = 10
+
+# Largest page getAuthorFeed returns; fewer, bigger pages cost fewer round trips
+FEED_PAGE_SIZE = 100
+
+# Error reported for posts that belong to another account, such as reposts
+NOT_OWN_POST_ERROR = "Post belongs to another account (e.g. a repost)"
+
+# Deletes sent per applyWrites request; the PDS accepts up to 200 writes
+DELETE_BATCH_SIZE = 25
+
+
+def _split_post_uri(uri: str) -> Optional[Tuple[str, str, str]]:
+    """Split an AT Protocol post URI into its repo, collection and record key.
+
+    Args:
+        uri: URI such as ``at://did:plc:abc/app.bsky.feed.post/3k2a``
+
+    Returns:
+        Tuple of (repo, collection, rkey), or None if the URI is malformed
+    """
+    if not uri.startswith("at://"):
+        return None
+    parts = uri[len("at://") :].split("/")
+    if len(parts) != 3 or not all(parts):
+        return None
+    return parts[0], parts[1], parts[2]
 
 
 class BlueskyPlatform(BasePlatform):
     """Bluesky platform implementation."""
 
+    delete_batch_size = DELETE_BATCH_SIZE
+
     def __init__(self, config: BlueskyConfig):
         """Initialize Bluesky platform.
 
         Args:
             config: Bluesky configuration
         """
-        super().__init__("bluesky")
+        super().__init__("bluesky", rate_per_sec=RATE_PER_SECOND, burst=RATE_BURST)
         self.config = config
         self.client: Optional[Client] = None
 
@@ -36,8 +83,13 @@ class BlueskyPlatform(BasePlatform):
             return False
 
         try:
-            self.client = Client()
-            profile = self.client.login(self.config.handle, self.config.password)
+            # Keep one client, and so one connection pool, for the platform's
+            # lifetime, even if authenticate is called again
+            if self.client is None:
+                self.client = Client()
+            profile = await self._call(
+                self.client.login, self.config.handle, self.config.password
+            )
             self._authenticated = True
             print(f"✅ Successfully authenticated with Bluesky as @{profile.handle}")
             return True
@@ -63,89 +115,118 @@ class BlueskyPlatform(BasePlatform):
         if not self._authenticated or not self.client:
             raise RuntimeError("Not authenticated with Bluesky")
 
-        posts: List[Post] = []
-        cursor = None
-        collected = 0
-
         try:
-            while True:
-                # Get posts from the API with proper parameter structure
-                params = {
-                    "actor": self.config.handle,
-                    "limit": min(50, limit - collected) if limit else 50,
-                }
-                if cursor:
-                    params["cursor"] = cursor
+            return [post async for post in self.iter_posts(start_date, end_date, limit)]
+        except Exception as e:
+            print(f"❌ Error retrieving Bluesky posts: {e}")
+            return []
+
+    async def iter_posts(
+        self, start_date: datetime, end_date: datetime, limit: Optional[int] = None
+    ) -> AsyncIterator[Post]:
+        """Yield posts from Bluesky within the date range as each page arrives.
 
-                response = self.client.app.bsky.feed.get_author_feed(params)
+        Args:
+            start_date: Start date for posts to retrieve
+            end_date: End date for posts to retrieve
+            limit: Maximum number of posts to retrieve
+
+        Yields:
+            Post objects, newest first
+        """
+        if not self._authenticated or not self.client:
+            raise RuntimeError("Not authenticated with Bluesky")
+
+        # Post dates are kept in aware UTC, so compare against the same
+        start_date = to_utc(start_date)
+        end_date = to_utc(end_date)
+
+        collected = 0
+        get_author_feed = self.client.app.bsky.feed.get_author_feed
+        platform_name = self.name
+        post_url_prefix = f"https://bsky.app/profile/{self.config.handle}/post/"
+
+        def fetch_page(cursor: Optional[str]) -> asyncio.Future:
+            # Get posts from the API with proper parameter structure
+            params = {
+                "actor": self.config.handle,
+                "limit": (
+                    min(FEED_PAGE_SIZE, limit - collected) if limit else FEED_PAGE_SIZE
+                ),
+            }
+            if cursor:
+                params["cursor"] = cursor
+            return asyncio.ensure_future(self._call(get_author_feed, params))
+
+        next_page: Optional[asyncio.Future] = fetch_page(None)
+        try:
+            while next_page is not None:
+                response = await next_page
+                next_page = None
 
                 if not response.feed:
                     break
 
+                # Request the next page before processing this one so that its
+                # download overlaps with the filtering below, unless this page
+                # alone may be enough to reach the limit
+                cursor = response.cursor
+                if cursor and not (limit and collected + len(response.feed) >= limit):
+                    next_page = fetch_page(cursor)
+
                 for feed_item in response.feed:
-                    if not feed_item.post:
+                    feed_post = feed_item.post
+                    if not feed_post:
                         continue
 
-                    post_record = feed_item.post.record
-                    if not hasattr(post_record, "created_at"):
+                    post_record = feed_post.record
+                    created_raw = getattr(post_record, "created_at", None)
+                    if created_raw is None:
                         continue
 
+                    uri = feed_post.uri
+
                     # Parse the created date with proper timezone handling
                     try:
-                        created_at = date_parser.isoparse(post_record.created_at)
-                        # Convert to naive datetime for comparison (assumes UTC)
-                        if created_at.tzinfo is not None:
-                            created_at = created_at.replace(tzinfo=None)
+                        created_at = to_utc(parse_iso_datetime(created_raw))
                     except (ValueError, AttributeError) as e:
-                        print(
-                            f"Warning: Failed to parse date for post {feed_item.post.uri}: {e}"
-                        )
+                        print(f"Warning: Failed to parse date for post {uri}: {e}")
                         continue
 
                     # Filter by date range
                     if created_at < start_date or created_at > end_date:
                         if created_at < start_date:
                             # We've gone too far back, stop fetching
-                            return posts
+                            return
                         continue
 
-                    # Extract post content
-                    content = getattr(post_record, "text", "")
+                    author = feed_post.author
 
-                    # Create Post object
-                    post = Post(
-                        id=feed_item.post.uri,
-                        content=content,
+                    yield Post(
+                        id=uri,
+                        content=getattr(post_record, "text", ""),
                         created_at=created_at,
-                        platform=self.name,
-                        url=f"https://bsky.app/profile/{self.config.handle}/post/{feed_item.post.uri.split('/')[-1]}",
+                        platform=platform_name,
+                        url=post_url_prefix + uri.rpartition("/")[2],
                         metadata={
-                            "uri": feed_item.post.uri,
-                            "cid": feed_item.post.cid,
-                            "author": (
-                                feed_item.post.author.handle
-                                if feed_item.post.author
-                                else None
-                            ),
+                            "uri": uri,
+                            "cid": feed_post.cid,
+                            "author": author.handle if author else None,
                         },
                     )
-
-                    posts.append(post)
                     collected += 1
 
                     if limit and collected >= limit:
-                        return posts
+                        return
 
                 # Check if there are more posts to fetch
-                cursor = response.cursor
-                if not cursor:
-                    break
+                if cursor and next_page is None:
+                    next_page = fetch_page(cursor)
 
-            return posts
-
-        except Exception as e:
-            print(f"❌ Error retrieving Bluesky posts: {e}")
-            return []
+        finally:
+            # Stopped early (date range or limit reached), drop the prefetch
+            if next_page is not None:
+                next_page.cancel()
 
     async def delete_post(self, post_id: str) -> DeletionResult:
         """Delete a specific Bluesky post.
@@ -163,19 +244,138 @@ class BlueskyPlatform(BasePlatform):
 
         try:
             # The post_id is the AT Protocol URI
-            # We need to extract the record key from it
-            uri_parts = post_id.split("/")
-            if len(uri_parts) < 2:
+            # We need the repo (the author's DID) and record key from it
+            parts = _split_post_uri(post_id)
+            if parts is None:
                 return DeletionResult(
                     post_id=post_id, success=False, error="Invalid post URI format"
                 )
+            repo, _, rkey = parts
 
-            rkey = uri_parts[-1]  # The record key is the last part of the URI
+            # Only the account's own repo can be written to, so don't send a
+            # request that is bound to fail for someone else's post
+            own_repo = self.client.me.did if self.client.me else None
+            if own_repo is not None and repo != own_repo:
+                return DeletionResult(
+                    post_id=post_id, success=False, error=NOT_OWN_POST_ERROR
+                )
 
             # Delete the post
-            self.client.app.bsky.feed.post.delete(rkey)
+            await self._call(self.client.app.bsky.feed.post.delete, repo, rkey)
 
             return DeletionResult(post_id=post_id, success=True)
 
         except Exception as e:
             return DeletionResult(post_id=post_id, success=False, error=str(e))
+
+    async def delete_posts(self, post_ids: List[str]) -> List[DeletionResult]:
+        """Delete several Bluesky posts with a single applyWrites request.
+
+        Only the account's own posts can be deleted. Posts from other repos,
+        such as reposted posts, are reported as failures without a request.
+        A lone post or a malformed URI goes through delete_post(). The batch is applied as one
+        commit, so if the PDS rejects it as invalid every post is retried on
+        its own to find out which ones fail. Other errors, such as rate limits
+        that outlasted the retries, fail the whole batch without more requests.
+
+        Args:
+            post_ids: URIs of the posts to delete
+
+        Returns:
+            DeletionResult objects, in the same order as ``post_ids``
+        """
+        if not self._authenticated or not self.client:
+            return [
+                DeletionResult(
+                    post_id=post_id,
+                    success=False,
+                    error="Not authenticated with Bluesky",
+                )
+                for post_id in post_ids
+            ]
+
+        own_repo = self.client.me.did if self.client.me else None
+        writes = {}
+        for post_id in post_ids:
+            parts = _split_post_uri(post_id)
+            if parts is not None and parts[0] == own_repo:
+                writes[post_id] = models.ComAtprotoRepoApplyWrites.Delete(
+                    collection=parts[1], rkey=parts[2]
+                )
+
+        batch_error: Optional[str] = None
+        if len(writes) < 2:
+            # A single post is no cheaper to delete through applyWrites
+            writes = {}
+        else:
+            try:
+                # Every write in the batch counts against the rate limit
+                await self._call_with_cost(
+                    len(writes),
+                    self.client.com.atproto.repo.apply_writes,
+                    models.ComAtprotoRepoApplyWrites.Data(
+                        repo=own_repo, writes=list(writes.values())
+                    ),
+                )
+            except BadRequestError as e:
+                logger.warning(
+                    f"Bluesky rejected a batch of {len(writes)} deletes, "
+                    f"deleting them one by one: {e}"
+                )
+                writes = {}
+            except Exception as e:
+                logger.warning(f"Batch of {len(writes)} Bluesky deletes failed: {e}")
+                batch_error = str(e)
+
+        results = []
+        for post_id in post_ids:
+            if post_id in writes:
+                results.append(
+                    DeletionResult(
+                        post_id=post_id,
+                        success=batch_error is None,
+                        error=batch_error,
+                    )
+                )
+            else:
+                results.append(await self.delete_post(post_id))
+        return results
+
+    @property
+    def account(self) -> str:
+        """Identify the account by its handle."""
+        return self.config.handle
+
+    def _retry_after(self, error: Exception) -> Optional[float]:
+        """Read the wait time from a Bluesky rate limit error."""
+        if RateLimitExceededError is not None and isinstance(
+            error, RateLimitExceededError
+        ):
+            retry_after = getattr(error, "retry_after", None)
+            if retry_after is not None:
+                return retry_after
+
+            reset_at = getattr(error, "reset_at", None)
+            if reset_at is not None:
+                return max((reset_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+            return 0.0
+
+        # Older SDKs only tell a rate limit apart by the response status
+        response = getattr(error, "response", None)
+        if not isinstance(error, RequestException) or (
+            getattr(response, "status_code", None) != 429
+        ):
+            return None
+
+        try:
+            reset = int((response.headers or {})["ratelimit-reset"])
+        except (KeyError, TypeError, ValueError):
+            return 0.0
+        return max(reset - datetime.now(timezone.utc).timestamp(), 0.0)
+
+    async def close(self) -> None:
+        """Close the HTTP connection pool held by the atproto client."""
+        if self.client:
+            self.client.request.close()
+        await super().close()
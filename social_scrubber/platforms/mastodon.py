@@ -1,14 +1,65 @@
 """Mastodon platform implementation."""
 
 import re
-from datetime import datetime
-from typing import List, Optional
+import time
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Optional
 
-from dateutil import parser as date_parser
-from mastodon import Mastodon
+import requests
+from mastodon import Mastodon, MastodonRatelimitError
+from requests.adapters import HTTPAdapter
 
 from ..config import MastodonConfig
-from .base import BasePlatform, DeletionResult, Post
+from ..dates import to_utc
+from .base import (
+    BasePlatform,
+    DeletionResult,
+    Post,
+    parse_iso_datetime,
+)
+
+# Keep-alive connections kept open to the instance for concurrent requests
+HTTP_POOL_SIZE = 16
+
+# Mastodon allows 300 API requests per 5 minutes per account
+RATE_PER_SECOND = 300 / 300
+RATE_BURST = 10
+
+# Matches the HTML tags Mastodon wraps status content in
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Seconds a snowflake ID's timestamp may be off from its status' created_at
+SNOWFLAKE_TOLERANCE = 60
+
+
+def _status_created_at(status: dict) -> datetime:
+    """Read a status' creation time as aware UTC, keeping microseconds."""
+    created_at = status["created_at"]
+    if isinstance(created_at, str):
+        created_at = parse_iso_datetime(created_at)
+    return to_utc(created_at)
+
+
+def _is_snowflake_id(status_id: object, created_at: datetime) -> bool:
+    """Tell whether a status ID encodes its creation time, as on Mastodon.
+
+    Mastodon's IDs are the creation time in milliseconds shifted left by 16
+    bits. GoToSocial, Pleroma and Akkoma use IDs that don't decode that way.
+    """
+    try:
+        millis = int(str(status_id)) >> 16
+    except ValueError:
+        return False
+    return abs(millis / 1000 - created_at.timestamp()) < SNOWFLAKE_TOLERANCE
+
+
+def _snowflake_max_id(end_date: datetime) -> str:
+    """Build a snowflake max_id that still returns posts made at end_date.
+
+    max_id is exclusive and the timestamp is in milliseconds, so the ID is
+    taken one second past the end; newer posts are filtered out afterwards.
+    """
+    return str(int((end_date.timestamp() + 1) * 1000) << 16)
 
 
 class MastodonPlatform(BasePlatform):
@@ -20,9 +71,12 @@ class MastodonPlatform(BasePlatform):
         Args:
             config: Mastodon configuration
         """
-        super().__init__("mastodon")
+        super().__init__("mastodon", rate_per_sec=RATE_PER_SECOND, burst=RATE_BURST)
         self.config = config
         self.client: Optional[Mastodon] = None
+        self._session: Optional[requests.Session] = None
+        # ID of the authenticated account, looked up once at login
+        self._account_id: Optional[str] = None
 
     async def authenticate(self) -> bool:
         """Authenticate with Mastodon.
@@ -37,13 +91,26 @@ class MastodonPlatform(BasePlatform):
             return False
 
         try:
+            if self._session is None:
+                self._session = requests.Session()
+                adapter = HTTPAdapter(pool_maxsize=HTTP_POOL_SIZE)
+                self._session.mount("https://", adapter)
+                self._session.mount("http://", adapter)
+
             self.client = Mastodon(
                 access_token=self.config.access_token,
                 api_base_url=self.config.api_base_url,
+                session=self._session,
+                # Raise on rate limits so _call backs off without blocking the loop
+                ratelimit_method="throw",
+                # Older Mastodon.py versions fetch the instance version on
+                # creation by default, costing a request before the login
+                version_check_mode="none",
             )
 
             # Verify credentials
-            account = self.client.me()
+            account = await self._call(self.client.me)
+            self._account_id = account["id"]
             self._authenticated = True
             print(
                 f"✅ Successfully authenticated with Mastodon as @{account['username']}"
@@ -71,92 +138,114 @@ class MastodonPlatform(BasePlatform):
         if not self._authenticated or not self.client:
             raise RuntimeError("Not authenticated with Mastodon")
 
-        posts: List[Post] = []
-        max_id = None
-        collected = 0
-
         try:
-            while True:
-                # Get posts from the API
-                batch_limit = min(40, limit - collected) if limit else 40
-                statuses = self.client.account_statuses(
-                    id=self.client.me()["id"],
-                    max_id=max_id,
-                    limit=batch_limit,
-                    only_media=False,
-                    exclude_replies=False,
-                    exclude_reblogs=True,  # Only get original posts
-                )
+            return [post async for post in self.iter_posts(start_date, end_date, limit)]
+        except Exception as e:
+            print(f"❌ Error retrieving Mastodon posts: {e}")
+            return []
 
-                if not statuses:
-                    break
-
-                for status in statuses:
-                    # Parse the created date with proper timezone handling
-                    try:
-                        created_at = status["created_at"]
-                        if isinstance(created_at, str):
-                            # Parse string datetime
-                            created_at = date_parser.isoparse(created_at)
-
-                        # Convert timezone-aware datetime to UTC, then make naive for comparison
-                        if (
-                            hasattr(created_at, "tzinfo")
-                            and created_at.tzinfo is not None
-                        ):
-                            created_at = created_at.utctimetuple()
-                            created_at = datetime(*created_at[:6])
-                        elif hasattr(created_at, "replace"):
-                            # If it's timezone-aware, convert to naive UTC
-                            created_at = created_at.replace(tzinfo=None)
-                    except (ValueError, AttributeError) as e:
-                        print(
-                            f"Warning: Failed to parse date for status {status['id']}: {e}"
-                        )
-                        continue
-
-                    # Filter by date range
-                    if created_at < start_date or created_at > end_date:
-                        if created_at < start_date:
-                            # We've gone too far back, stop fetching
-                            return posts
-                        continue
-
-                    # Extract post content (remove HTML tags)
-                    content = re.sub(r"<[^>]+>", "", status["content"])
-
-                    # Create Post object
-                    post = Post(
-                        id=str(status["id"]),
-                        content=content,
-                        created_at=created_at,
-                        platform=self.name,
-                        url=status["url"],
-                        metadata={
-                            "visibility": status["visibility"],
-                            "replies_count": status["replies_count"],
-                            "reblogs_count": status["reblogs_count"],
-                            "favourites_count": status["favourites_count"],
-                        },
-                    )
+    async def iter_posts(
+        self, start_date: datetime, end_date: datetime, limit: Optional[int] = None
+    ) -> AsyncIterator[Post]:
+        """Yield posts from Mastodon within the date range as each page arrives.
 
-                    posts.append(post)
-                    collected += 1
+        Args:
+            start_date: Start date for posts to retrieve
+            end_date: End date for posts to retrieve
+            limit: Maximum number of posts to retrieve
 
-                    if limit and collected >= limit:
-                        return posts
+        Yields:
+            Post objects, newest first
+        """
+        if not self._authenticated or not self.client:
+            raise RuntimeError("Not authenticated with Mastodon")
 
-                # Update max_id for pagination
-                if statuses:
-                    max_id = statuses[-1]["id"]
-                else:
-                    break
+        # Post dates are kept in aware UTC, so compare against the same
+        start_date = to_utc(start_date)
+        end_date = to_utc(end_date)
 
-            return posts
+        # For a window that ended in the past, jump to its end instead of
+        # paging through every newer post. That needs time-based status IDs,
+        # so it is only done once the newest page shows the server uses them.
+        seek_to_end = end_date < datetime.now(timezone.utc)
+        max_id: Optional[str] = None
+        collected = 0
 
-        except Exception as e:
-            print(f"❌ Error retrieving Mastodon posts: {e}")
-            return []
+        while True:
+            # Get posts from the API
+            batch_limit = min(40, limit - collected) if limit else 40
+            statuses = await self._call(
+                self.client.account_statuses,
+                id=self._account_id,
+                max_id=max_id,
+                limit=batch_limit,
+                only_media=False,
+                exclude_replies=False,
+                exclude_reblogs=True,  # Only get original posts
+            )
+
+            if not statuses:
+                break
+
+            if seek_to_end:
+                seek_to_end = False
+                oldest = statuses[-1]
+                try:
+                    oldest_created_at = _status_created_at(oldest)
+                except (ValueError, AttributeError):
+                    oldest_created_at = None
+                if (
+                    oldest_created_at is not None
+                    and oldest_created_at > end_date
+                    and _is_snowflake_id(oldest["id"], oldest_created_at)
+                ):
+                    # The whole page is newer than the window, skip ahead
+                    max_id = _snowflake_max_id(end_date)
+                    continue
+
+            for status in statuses:
+                # Parse the created date with proper timezone handling
+                try:
+                    created_at = _status_created_at(status)
+                except (ValueError, AttributeError) as e:
+                    print(
+                        f"Warning: Failed to parse date for status {status['id']}: {e}"
+                    )
+                    continue
+
+                # Filter by date range
+                if created_at < start_date or created_at > end_date:
+                    if created_at < start_date:
+                        # We've gone too far back, stop fetching
+                        return
+                    continue
+
+                # Extract post content (remove HTML tags)
+                content = _HTML_TAG_RE.sub("", status["content"])
+
+                yield Post(
+                    id=str(status["id"]),
+                    content=content,
+                    created_at=created_at,
+                    platform=self.name,
+                    url=status["url"],
+                    metadata={
+                        "visibility": status["visibility"],
+                        "replies_count": status["replies_count"],
+                        "reblogs_count": status["reblogs_count"],
+                        "favourites_count": status["favourites_count"],
+                    },
+                )
+                collected += 1
+
+                if limit and collected >= limit:
+                    return
+
+            # Update max_id for pagination
+            if statuses:
+                max_id = statuses[-1]["id"]
+            else:
+                break
 
     async def delete_post(self, post_id: str) -> DeletionResult:
         """Delete a specific Mastodon post.
@@ -174,9 +263,32 @@ class MastodonPlatform(BasePlatform):
 
         try:
             # Delete the status
-            self.client.status_delete(post_id)
+            await self._call(self.client.status_delete, post_id)
 
             return DeletionResult(post_id=post_id, success=True)
 
         except Exception as e:
             return DeletionResult(post_id=post_id, success=False, error=str(e))
+
+    @property
+    def account(self) -> str:
+        """Identify the account by its instance URL and, once logged in, its ID."""
+        return f"{self.config.api_base_url}|{self._account_id or ''}"
+
+    def _retry_after(self, error: Exception) -> Optional[float]:
+        """Read the wait time from a Mastodon rate limit error."""
+        if not isinstance(error, MastodonRatelimitError):
+            return None
+
+        reset = getattr(self.client, "ratelimit_reset", None)
+        if reset:
+            return max(float(reset) - time.time(), 0.0)
+
+        return 0.0
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session shared by all Mastodon API calls."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        await super().close()
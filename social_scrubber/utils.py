@@ -1,10 +1,14 @@
 """Utilities for Social Scrubber."""
 
+import asyncio
+import atexit
 import logging
+import queue
 import sys
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from rich.console import Console
 from rich.panel import Panel
@@ -14,21 +18,63 @@ from .platforms.base import DeletionResult, Post
 
 console = Console()
 
+# Background thread writing queued log records, once logging is set up
+_log_listener: Optional[QueueListener] = None
+
+# Turns line breaks into spaces so a content preview stays on one table row
+_LINE_BREAKS_TO_SPACES = str.maketrans("\r\n", "  ")
+
+# Listings longer than this are printed as plain lines instead of a table
+MAX_TABLE_ROWS = 500
+
+
+def install_uvloop() -> bool:
+    """Make uvloop the event loop for every later asyncio.run, if installed.
+
+    Returns:
+        True if the uvloop event loop policy was installed
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
 
 def setup_logging(log_level: str = "INFO"):
     """Setup logging configuration.
 
+    Log records are put on a queue and written to stdout and the log file by
+    a background thread, so logging never waits on terminal or disk I/O.
+    Calling this again only changes the level.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
     """
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
+    global _log_listener
+
+    root = logging.getLogger()
+    if _log_listener is None and not root.handlers:
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        )
+        handlers = [
             logging.StreamHandler(sys.stdout),
             logging.FileHandler("social_scrubber.log"),
-        ],
-    )
+        ]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _log_listener = QueueListener(log_queue, *handlers)
+        _log_listener.start()
+        # Flush whatever is still queued before the process exits
+        atexit.register(_log_listener.stop)
+        root.addHandler(QueueHandler(log_queue))
+
+    root.setLevel(getattr(logging, log_level.upper()))
 
 
 def display_posts_table(posts: List[Post], title: str = "Posts"):
@@ -42,25 +88,45 @@ def display_posts_table(posts: List[Post], title: str = "Posts"):
         console.print(f"[yellow]No posts found for {title.lower()}[/yellow]")
         return
 
+    # Only a handful of platforms, so title-case each name once
+    platform_titles = {}
+    rows = []
+    for post in posts:
+        platform_title = platform_titles.get(post.platform)
+        if platform_title is None:
+            platform_title = platform_titles[post.platform] = post.platform.title()
+
+        content = post.content
+        content_preview = content[:50] + ("..." if len(content) > 50 else "")
+
+        rows.append(
+            (
+                platform_title,
+                # "YYYY-MM-DD HH:MM", without any UTC offset
+                post.created_at.isoformat(sep=" ", timespec="minutes")[:16],
+                # Replace newlines with spaces for table display
+                content_preview.translate(_LINE_BREAKS_TO_SPACES),
+                post.id[-12:],  # Show last 12 chars of ID
+            )
+        )
+
+    if len(rows) > MAX_TABLE_ROWS:
+        # Laying out a table measures every cell, which gets slow for long
+        # listings, so print those as tab-separated lines instead
+        console.print(f"[bold]{title} ({len(posts)} posts)[/bold]")
+        console.print(
+            "\n".join("\t".join(row) for row in rows), markup=False, highlight=False
+        )
+        return
+
     table = Table(title=f"{title} ({len(posts)} posts)")
     table.add_column("Platform", style="cyan", no_wrap=True)
     table.add_column("Date", style="magenta", no_wrap=True)
     table.add_column("Content Preview", style="green")
     table.add_column("Post ID", style="dim", no_wrap=True)
 
-    for post in posts:
-        content_preview = (
-            post.content[:50] + "..." if len(post.content) > 50 else post.content
-        )
-        # Replace newlines with spaces for table display
-        content_preview = content_preview.replace("\n", " ").replace("\r", " ")
-
-        table.add_row(
-            post.platform.title(),
-            post.created_at.strftime("%Y-%m-%d %H:%M"),
-            content_preview,
-            post.id[-12:],  # Show last 12 chars of ID
-        )
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
@@ -75,15 +141,22 @@ def display_deletion_results(results: List[DeletionResult], platform: str):
     if not results:
         return
 
-    successful = [r for r in results if r.success]
-    failed = [r for r in results if not r.success]
-    archived = [r for r in results if r.archived]
+    # Count everything in one pass; only the failures are listed afterwards
+    successful = archived = 0
+    failed = []
+    for result in results:
+        if result.success:
+            successful += 1
+        else:
+            failed.append(result)
+        if result.archived:
+            archived += 1
 
     # Summary panel
     summary_text = f"""
-✅ Successfully deleted: {len(successful)}
+✅ Successfully deleted: {successful}
 ❌ Failed to delete: {len(failed)}
-📁 Archived: {len(archived)}
+📁 Archived: {archived}
     """
 
     console.print(
@@ -0,0 +1,109 @@
+"""Shared pytest configuration and helpers for the CLI tests."""
+
+import importlib.util
+from contextlib import ExitStack
+from dataclasses import dataclass
+from functools import partial
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from social_scrubber.cli import SocialScrubber
+from social_scrubber.config import Config, ScrubConfig
+from social_scrubber.platforms.base import BasePlatform
+
+# Same optional speedup as the CLI: use uvloop for the event loop if installed
+_HAS_UVLOOP = importlib.util.find_spec("uvloop") is not None
+
+PLATFORM_NAMES = ["bluesky", "mastodon", "twitter"]
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """Run the tests marked with anyio on asyncio, under uvloop when available."""
+    return ("asyncio", {"use_uvloop": _HAS_UVLOOP})
+
+
+@dataclass
+class FakePlatformConfig:
+    """Platform config whose configured state a test can change."""
+
+    is_configured: bool = True
+
+
+async def iter_posts(posts_by_platform):
+    """Yield platform posts the way iter_posts_from_platforms does."""
+    for platform_name, posts in posts_by_platform.items():
+        yield platform_name, posts
+
+
+def make_config(**scrub_options):
+    """Create a configuration with all platforms configured."""
+    return Config(
+        bluesky=FakePlatformConfig(),
+        mastodon=FakePlatformConfig(),
+        twitter=FakePlatformConfig(),
+        scrub=ScrubConfig(**scrub_options),
+        log_level="INFO",
+    )
+
+
+def make_platforms(is_authenticated=True):
+    """Create mock platforms with async login, listing and close methods."""
+    platforms = {}
+    for platform_name in PLATFORM_NAMES:
+        platform = Mock()
+        platform.display_name = platform_name.title()
+        platform.is_authenticated = is_authenticated
+        platform.authenticate = AsyncMock(return_value=True)
+        platform.close = AsyncMock()
+        # Posts are listed through the default iter_posts, built on get_posts
+        platform.iter_posts = partial(BasePlatform.iter_posts, platform)
+        platforms[platform_name] = platform
+    return platforms
+
+
+def make_scrubber(config, platforms):
+    """Create a SocialScrubber using the given config and platforms."""
+    with patch("social_scrubber.cli.Config") as MockConfig, patch(
+        "social_scrubber.cli.setup_logging"
+    ):
+        MockConfig.from_env.return_value = config
+
+        scrubber = SocialScrubber()
+        scrubber.platforms = platforms
+
+        return scrubber
+
+
+@pytest.fixture
+def cli_patches(scrubber):
+    """Patch out everything run_interactive calls around fetching and deleting.
+
+    Uses the requesting module's scrubber fixture and yields the mocks by the
+    name of what they replace. confirm_action returns True, so runs go on past
+    the confirmation prompt.
+    """
+    with ExitStack() as stack:
+        patches = {
+            name: stack.enter_context(patch.object(scrubber, name))
+            for name in (
+                "authenticate_platforms",
+                "iter_posts_from_platforms",
+                "delete_posts_from_platform",
+            )
+        }
+        for name in (
+            "print_banner",
+            "console",
+            "print_platform_status",
+            "confirm_action",
+            "format_date_range",
+            "display_posts_table",
+            "display_deletion_results",
+            "Progress",
+        ):
+            patches[name] = stack.enter_context(patch(f"social_scrubber.cli.{name}"))
+        patches["confirm_action"].return_value = True
+
+        yield patches
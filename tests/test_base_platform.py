@@ -1,10 +1,63 @@
 """Test base platform functionality."""
 
-from datetime import datetime, timedelta
+import asyncio
+import json
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from social_scrubber.platforms.base import DeletionResult, Post
+from social_scrubber.platforms._archive import _dumps_line
+from social_scrubber.platforms.base import (
+    BasePlatform,
+    DeletionResult,
+    Post,
+    parse_iso_datetime,
+)
+
+
+class FakePlatform(BasePlatform):
+    """Minimal platform that records how many deletions run at once."""
+
+    def __init__(self):
+        """Initialize the fake platform."""
+        super().__init__("fake")
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def authenticate(self) -> bool:
+        """Pretend to authenticate."""
+        self._authenticated = True
+        return True
+
+    async def get_posts(self, start_date, end_date, limit=None):
+        """Return no posts."""
+        return []
+
+    async def delete_post(self, post_id: str) -> DeletionResult:
+        """Pretend to delete a post, failing for IDs starting with 'bad'."""
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if post_id.startswith("bad"):
+            raise RuntimeError("delete failed")
+        return DeletionResult(post_id=post_id, success=True)
+
+
+def make_posts(count, prefix="post"):
+    """Create a list of posts for bulk deletion tests."""
+    return [
+        Post(
+            id=f"{prefix}{i}",
+            content=f"Post {i}",
+            created_at=datetime(2024, 1, 15, 10, 30, 0),
+            platform="fake",
+        )
+        for i in range(count)
+    ]
 
 
 class TestPost:
@@ -53,6 +106,17 @@ class TestPost:
         assert "..." in str_repr
         assert len(str_repr.split(": ")[1]) <= 53  # 50 chars + "..."
 
+    @pytest.mark.skipif(
+        sys.version_info < (3, 10), reason="dataclass slots need Python 3.10"
+    )
+    def test_post_has_no_instance_dict(self):
+        """Test that posts are slotted, keeping thousands of them small."""
+        post = Post(id="123", content="", created_at=datetime(2024, 1, 1), platform="x")
+
+        assert not hasattr(post, "__dict__")
+        with pytest.raises(AttributeError):
+            post.unknown = True
+
 
 class TestDeletionResult:
     """Test DeletionResult data class."""
@@ -88,3 +152,267 @@ class TestDeletionResult:
         assert result.success is True
         assert result.archived is True
         assert result.archive_path == "/path/to/archive.json"
+
+
+class TestBulkDelete:
+    """Test BasePlatform.bulk_delete_posts."""
+
+    @pytest.mark.anyio
+    async def test_bulk_delete_respects_max_concurrency(self):
+        """Test that no more than max_concurrency deletions run at once."""
+        platform = FakePlatform()
+        posts = make_posts(10)
+
+        results = await platform.bulk_delete_posts(
+            posts, archive_before_delete=False, max_concurrency=3
+        )
+
+        assert platform.max_in_flight == 3
+        assert [r.post_id for r in results] == [p.id for p in posts]
+        assert all(r.success for r in results)
+
+    @pytest.mark.anyio
+    async def test_bulk_delete_reports_exceptions_as_failures(self):
+        """Test that an exception on one post becomes a failed result."""
+        platform = FakePlatform()
+        posts = make_posts(1) + make_posts(1, prefix="bad")
+
+        results = await platform.bulk_delete_posts(posts, archive_before_delete=False)
+
+        assert results[0].success is True
+        assert results[1].success is False
+        assert results[1].error == "delete failed"
+
+    @pytest.mark.anyio
+    async def test_bulk_delete_reports_each_result(self):
+        """Test that on_result is called once per post as it completes."""
+        platform = FakePlatform()
+        posts = make_posts(4)
+        reported = []
+
+        results = await platform.bulk_delete_posts(
+            posts, archive_before_delete=False, on_result=reported.append
+        )
+
+        assert sorted(r.post_id for r in reported) == sorted(p.id for p in posts)
+        assert [r.post_id for r in results] == [p.id for p in posts]
+
+    @pytest.mark.anyio
+    async def test_bulk_delete_hands_posts_over_in_batches(self):
+        """Test that delete_posts gets up to delete_batch_size posts at a time."""
+        platform = FakePlatform()
+        platform.delete_batch_size = 3
+        posts = make_posts(10)
+        reported = []
+
+        with patch.object(
+            platform, "delete_posts", wraps=platform.delete_posts
+        ) as delete_posts:
+            results = await platform.bulk_delete_posts(
+                posts, archive_before_delete=False, on_result=reported.append
+            )
+
+        batch_sizes = sorted(len(c.args[0]) for c in delete_posts.call_args_list)
+        assert batch_sizes == [1, 3, 3, 3]
+        assert [r.post_id for r in results] == [p.id for p in posts]
+        assert len(reported) == 10
+
+    @pytest.mark.anyio
+    async def test_bulk_delete_handles_empty_list(self):
+        """Test that deleting no posts returns no results."""
+        platform = FakePlatform()
+
+        assert await platform.bulk_delete_posts([], archive_before_delete=False) == []
+
+    @pytest.mark.anyio
+    async def test_bulk_delete_propagates_callback_errors(self):
+        """Test that a failing on_result callback stops the run instead of hanging."""
+        platform = FakePlatform()
+
+        def fail(result):
+            raise ValueError("callback failed")
+
+        with pytest.raises(ValueError, match="callback failed"):
+            await asyncio.wait_for(
+                platform.bulk_delete_posts(
+                    make_posts(20),
+                    archive_before_delete=False,
+                    max_concurrency=2,
+                    on_result=fail,
+                ),
+                timeout=5,
+            )
+
+
+class RateLimited(Exception):
+    """Rate limit error raised by the fake SDK."""
+
+
+class RateLimitedPlatform(FakePlatform):
+    """Fake platform whose SDK raises RateLimited on a rate limit."""
+
+    def _retry_after(self, error):
+        """Treat RateLimited as a rate limit without a Retry-After value."""
+        return 0.0 if isinstance(error, RateLimited) else None
+
+
+class TestCall:
+    """Test BasePlatform._call."""
+
+    @pytest.mark.anyio
+    async def test_call_retries_rate_limits_with_backoff(self):
+        """Test that rate-limited calls are retried with exponential backoff."""
+        platform = RateLimitedPlatform()
+        func = Mock(side_effect=[RateLimited(), RateLimited(), "ok"])
+
+        with patch(
+            "social_scrubber.platforms.base.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            assert await platform._call(func, "arg", key="value") == "ok"
+
+        assert func.call_count == 3
+        func.assert_called_with("arg", key="value")
+        assert [call.args[0] for call in mock_sleep.await_args_list] == [1, 2]
+
+    @pytest.mark.anyio
+    async def test_call_does_not_retry_other_errors(self):
+        """Test that errors that are not rate limits are raised immediately."""
+        platform = RateLimitedPlatform()
+        func = Mock(side_effect=ValueError("bad request"))
+
+        with pytest.raises(ValueError, match="bad request"):
+            await platform._call(func)
+
+        func.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_call_gives_up_after_max_retries(self):
+        """Test that a call that keeps hitting the rate limit eventually fails."""
+        platform = RateLimitedPlatform()
+        func = Mock(side_effect=RateLimited())
+
+        with patch(
+            "social_scrubber.platforms.base.asyncio.sleep", new_callable=AsyncMock
+        ):
+            with pytest.raises(RateLimited):
+                await platform._call(func)
+
+        assert func.call_count == 6
+
+
+class TestArchivePost:
+    """Test BasePlatform._archive_post."""
+
+    @pytest.mark.anyio
+    async def test_archive_post_writes_readable_json(self, tmp_path):
+        """Test that an archived post can be read back with its content intact."""
+        platform = FakePlatform()
+        post = Post(
+            id="at://did:plc:abc/app.bsky.feed.post/1",
+            content="Café ☕",
+            created_at=datetime(2024, 1, 15, 10, 30, 0),
+            platform="fake",
+            metadata={"cid": "abc"},
+        )
+
+        archive_file = await platform._archive_post(post, str(tmp_path))
+        await platform.close()
+
+        with open(archive_file, encoding="utf-8") as f:
+            data = json.loads(f.readline())
+        assert data["post_id"] == post.id
+        assert data["content"] == "Café ☕"
+        assert data["created_at"] == "2024-01-15T10:30:00"
+        assert data["metadata"] == {"cid": "abc"}
+        assert datetime.fromisoformat(data["archived_at"]).tzinfo == timezone.utc
+
+    @pytest.mark.anyio
+    async def test_archive_directory_created_once(self, tmp_path):
+        """Test that archiving many posts only creates the directory once."""
+        platform = FakePlatform()
+        archive_path = str(tmp_path / "archives")
+
+        with patch(
+            "social_scrubber.platforms.base.Path.mkdir", autospec=True
+        ) as mock_mkdir:
+            mock_mkdir.side_effect = lambda path, **kwargs: os.makedirs(
+                path, exist_ok=True
+            )
+            for post in make_posts(3):
+                assert await platform._archive_post(post, archive_path) is not None
+        await platform.close()
+
+        mock_mkdir.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_archived_posts_share_one_jsonl_file(self, tmp_path):
+        """Test that a run appends every archived post to the same file."""
+        platform = FakePlatform()
+        posts = make_posts(3)
+
+        results = await platform.bulk_delete_posts(
+            posts, archive_before_delete=True, archive_path=str(tmp_path)
+        )
+        await platform.close()
+
+        archive_files = {r.archive_path for r in results}
+        assert len(archive_files) == 1
+        archive_file = archive_files.pop()
+        assert archive_file.endswith(".jsonl")
+        with open(archive_file, encoding="utf-8") as f:
+            archived_ids = [json.loads(line)["post_id"] for line in f]
+        assert sorted(archived_ids) == sorted(p.id for p in posts)
+        assert all(r.archived for r in results)
+
+    @pytest.mark.anyio
+    async def test_archive_post_returns_none_on_failure(self, tmp_path):
+        """Test that a write error is reported as a failed archive, not raised."""
+        platform = FakePlatform()
+        blocker = tmp_path / "not-a-directory"
+        blocker.write_text("")
+
+        archive_file = await platform._archive_post(make_posts(1)[0], str(blocker))
+
+        assert archive_file is None
+
+    @pytest.mark.anyio
+    async def test_context_manager_closes_archive_files(self, tmp_path):
+        """Test that leaving the platform's context closes its archive file."""
+        async with FakePlatform() as platform:
+            await platform._archive_post(make_posts(1)[0], str(tmp_path))
+            writer = platform._archive_writers[str(tmp_path)]
+            assert writer._file is not None
+
+        assert writer._file is None
+        assert platform._archive_writers == {}
+
+    def test_archive_lines_are_compact(self):
+        """Test that the stdlib fallback writes JSON without extra whitespace."""
+        with patch("social_scrubber.platforms._archive.orjson", None):
+            line = _dumps_line({"post_id": "1", "content": "Café"})
+
+        assert line == '{"post_id":"1","content":"Café"}\n'.encode("utf-8")
+
+
+class TestParseIsoDatetime:
+    """Test parse_iso_datetime."""
+
+    def test_z_suffix_is_utc(self):
+        """Test that a trailing Z is read as UTC."""
+        assert parse_iso_datetime("2024-01-01T12:00:00.123Z") == datetime(
+            2024, 1, 1, 12, 0, 0, 123000, tzinfo=timezone.utc
+        )
+
+    def test_offset_is_kept(self):
+        """Test that an explicit UTC offset is preserved."""
+        value = parse_iso_datetime("2024-01-01T07:00:00-05:00")
+
+        assert value.utcoffset() == timedelta(hours=-5)
+
+    def test_falls_back_to_dateutil(self):
+        """Test that forms fromisoformat rejects are still parsed."""
+        with patch("social_scrubber.platforms.base.datetime") as mock_datetime:
+            mock_datetime.fromisoformat.side_effect = ValueError
+            value = parse_iso_datetime("2024-01-01T12:00:00Z")
+
+        assert value == datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
@@ -1,23 +1,76 @@
 """Tests for Bluesky platform API fixes."""
 
+import asyncio
+import logging
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from typing import List, Optional
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from atproto_client.exceptions import BadRequestError, NetworkError, RequestException
+from freezegun import freeze_time
 
 from social_scrubber.config import BlueskyConfig
 from social_scrubber.platforms.base import Post
-from social_scrubber.platforms.bluesky import BlueskyPlatform
+from social_scrubber.platforms.bluesky import NOT_OWN_POST_ERROR, BlueskyPlatform
+
+
+@dataclass
+class FakeRecord:
+    """Post record as found in getAuthorFeed results."""
+
+    created_at: str
+    text: str = "Test post"
+
+
+@dataclass
+class FakeAuthor:
+    """Post author as found in getAuthorFeed results."""
+
+    handle: str = "test.bsky.social"
+
+
+@dataclass
+class FakePost:
+    """Post view as found in getAuthorFeed results."""
+
+    uri: str
+    cid: str
+    record: FakeRecord
+    author: FakeAuthor = field(default_factory=FakeAuthor)
+
+
+@dataclass
+class FakeFeedItem:
+    """Feed item as found in getAuthorFeed results."""
+
+    post: FakePost
+
+
+@dataclass
+class FakeFeedResponse:
+    """Page of getAuthorFeed results."""
+
+    feed: List[FakeFeedItem]
+    cursor: Optional[str] = None
+
+
+def make_feed_item(rkey="test1", text="Test post", created_at="2024-01-01T12:00:00Z"):
+    """Create a feed item for one of the test account's posts."""
+    return FakeFeedItem(
+        post=FakePost(
+            uri=f"at://did:plc:test/app.bsky.feed.post/{rkey}",
+            cid=f"cid_{rkey}",
+            record=FakeRecord(created_at=created_at, text=text),
+        )
+    )
 
 
 @pytest.fixture
 def mock_bluesky_config():
-    """Create a mock Bluesky configuration."""
-    config = Mock(spec=BlueskyConfig)
-    config.handle = "test.bsky.social"
-    config.password = "test_password"
-    config.is_configured = True
-    return config
+    """Create a Bluesky configuration with test credentials."""
+    return BlueskyConfig(handle="test.bsky.social", password="test_password")
 
 
 @pytest.fixture
@@ -26,26 +79,31 @@ def bluesky_platform(mock_bluesky_config):
     return BlueskyPlatform(mock_bluesky_config)
 
 
+@pytest.fixture
+def authed_platform(bluesky_platform):
+    """Log the platform in with a mocked client serving one empty feed page.
+
+    Returns:
+        Tuple of the platform, its mocked get_author_feed and the page it
+        returns, which tests can fill in or replace
+    """
+    client = Mock()
+    get_author_feed = client.app.bsky.feed.get_author_feed
+    response = FakeFeedResponse(feed=[])
+    get_author_feed.return_value = response
+
+    bluesky_platform._authenticated = True
+    bluesky_platform.client = client
+    return bluesky_platform, get_author_feed, response
+
+
 class TestBlueskyAPIFixes:
     """Test cases for Bluesky API parameter fixes."""
 
-    @pytest.mark.asyncio
-    async def test_get_posts_api_call_with_correct_params(
-        self, bluesky_platform, mock_bluesky_config
-    ):
+    @pytest.mark.anyio
+    async def test_get_posts_api_call_with_correct_params(self, authed_platform):
         """Test that get_posts calls the API with correct parameter structure."""
-        # Mock the client and response
-        mock_client = Mock()
-        mock_response = Mock()
-        mock_response.feed = []  # Empty feed to end the loop
-        mock_response.cursor = None  # No cursor
-
-        # Mock the API method
-        mock_client.app.bsky.feed.get_author_feed.return_value = mock_response
-
-        # Set up the platform
-        bluesky_platform._authenticated = True
-        bluesky_platform.client = mock_client
+        bluesky_platform, get_author_feed, _ = authed_platform
 
         # Call get_posts
         _ = await bluesky_platform.get_posts(
@@ -53,8 +111,8 @@ class TestBlueskyAPIFixes:
         )  # We don't need the result for this test
 
         # Verify the API was called with correct parameter structure
-        mock_client.app.bsky.feed.get_author_feed.assert_called_once()
-        call_args = mock_client.app.bsky.feed.get_author_feed.call_args
+        get_author_feed.assert_called_once()
+        call_args = get_author_feed.call_args
 
         # Check that it was called with a params dict as first argument
         assert len(call_args[0]) == 1  # Should have exactly one positional argument
@@ -66,43 +124,16 @@ class TestBlueskyAPIFixes:
         assert params["limit"] == 10
         assert "cursor" not in params  # No cursor on first call
 
-    @pytest.mark.asyncio
-    async def test_get_posts_api_call_with_cursor(
-        self, bluesky_platform, mock_bluesky_config
-    ):
+    @pytest.mark.anyio
+    async def test_get_posts_api_call_with_cursor(self, authed_platform):
         """Test that get_posts includes cursor in parameters when paginating."""
-        # Mock the client and responses
-        mock_client = Mock()
-
-        # First response with cursor
-        mock_response1 = Mock()
-        mock_feed_item1 = Mock()
-        mock_post1 = Mock()
-        mock_record1 = Mock()
-        mock_record1.created_at = "2024-01-01T12:00:00Z"  # Within date range
-        mock_record1.text = "Test post"
-        mock_post1.record = mock_record1
-        mock_post1.uri = "at://did:plc:test/app.bsky.feed.post/test1"
-        mock_post1.cid = "test_cid_1"
-        mock_post1.author = Mock()
-        mock_post1.author.handle = "test.bsky.social"
-        mock_feed_item1.post = mock_post1
-        mock_response1.feed = [mock_feed_item1]
-        mock_response1.cursor = "test_cursor"
-
-        # Second response without cursor (end of pagination)
-        mock_response2 = Mock()
-        mock_response2.feed = []
-
-        # Set up the API method to return different responses
-        mock_client.app.bsky.feed.get_author_feed.side_effect = [
-            mock_response1,
-            mock_response2,
-        ]
+        bluesky_platform, get_author_feed, _ = authed_platform
 
-        # Set up the platform
-        bluesky_platform._authenticated = True
-        bluesky_platform.client = mock_client
+        # First response with cursor, then one without (end of pagination)
+        get_author_feed.side_effect = [
+            FakeFeedResponse(feed=[make_feed_item()], cursor="test_cursor"),
+            FakeFeedResponse(feed=[]),
+        ]
 
         # Call get_posts
         _ = await bluesky_platform.get_posts(
@@ -110,23 +141,23 @@ class TestBlueskyAPIFixes:
         )  # We don't need the result for this test
 
         # Verify the API was called twice
-        assert mock_client.app.bsky.feed.get_author_feed.call_count == 2
+        assert get_author_feed.call_count == 2
 
         # Check first call (no cursor)
-        first_call_args = mock_client.app.bsky.feed.get_author_feed.call_args_list[0]
+        first_call_args = get_author_feed.call_args_list[0]
         first_params = first_call_args[0][0]
         assert isinstance(first_params, dict)
         assert first_params["actor"] == "test.bsky.social"
         assert "cursor" not in first_params
 
         # Check second call (with cursor)
-        second_call_args = mock_client.app.bsky.feed.get_author_feed.call_args_list[1]
+        second_call_args = get_author_feed.call_args_list[1]
         second_params = second_call_args[0][0]
         assert isinstance(second_params, dict)
         assert second_params["actor"] == "test.bsky.social"
         assert second_params["cursor"] == "test_cursor"
 
-    @pytest.mark.asyncio
+    @pytest.mark.anyio
     async def test_get_posts_not_authenticated_raises_error(self, bluesky_platform):
         """Test that get_posts raises error when not authenticated."""
         # Ensure platform is not authenticated
@@ -139,7 +170,7 @@ class TestBlueskyAPIFixes:
                 start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 2)
             )
 
-    @pytest.mark.asyncio
+    @pytest.mark.anyio
     async def test_get_posts_no_client_raises_error(self, bluesky_platform):
         """Test that get_posts raises error when client is None."""
         # Set authenticated but no client
@@ -152,35 +183,18 @@ class TestBlueskyAPIFixes:
                 start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 2)
             )
 
-    @pytest.mark.asyncio
-    async def test_get_posts_processes_response_correctly(
-        self, bluesky_platform, mock_bluesky_config
-    ):
+    @pytest.mark.anyio
+    async def test_get_posts_processes_response_correctly(self, authed_platform):
         """Test that get_posts correctly processes API response into Post objects."""
-        # Mock the client and response
-        mock_client = Mock()
-        mock_response = Mock()
-
-        # Create a mock feed item
-        mock_feed_item = Mock()
-        mock_post = Mock()
-        mock_record = Mock()
-        mock_record.created_at = "2024-01-01T12:00:00.000Z"  # Within date range
-        mock_record.text = "Test post content"
-        mock_post.record = mock_record
-        mock_post.uri = "at://did:plc:test/app.bsky.feed.post/test123"
-        mock_post.cid = "test_cid"
-        mock_post.author = Mock()
-        mock_post.author.handle = "test.bsky.social"
-        mock_feed_item.post = mock_post
-
-        mock_response.feed = [mock_feed_item]
-        mock_response.cursor = None  # No more pages - this prevents infinite loop
-        mock_client.app.bsky.feed.get_author_feed.return_value = mock_response
-
-        # Set up the platform
-        bluesky_platform._authenticated = True
-        bluesky_platform.client = mock_client
+        bluesky_platform, _, response = authed_platform
+        # One post within the date range, and no more pages
+        response.feed = [
+            make_feed_item(
+                rkey="test123",
+                text="Test post content",
+                created_at="2024-01-01T12:00:00.000Z",
+            )
+        ]
 
         # Call get_posts
         posts = await bluesky_platform.get_posts(
@@ -198,23 +212,13 @@ class TestBlueskyAPIFixes:
         )  # Full URI as ID
         assert post.content == "Test post content"  # Note: content, not text
         assert post.platform == "bluesky"
-        assert isinstance(post.created_at, datetime)
+        assert post.created_at == datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+        assert post.created_at.tzinfo is timezone.utc
 
-    @pytest.mark.asyncio
-    async def test_get_posts_handles_empty_response(
-        self, bluesky_platform, mock_bluesky_config
-    ):
+    @pytest.mark.anyio
+    async def test_get_posts_handles_empty_response(self, authed_platform):
         """Test that get_posts handles empty API response correctly."""
-        # Mock the client and empty response
-        mock_client = Mock()
-        mock_response = Mock()
-        mock_response.feed = []
-        mock_response.cursor = None  # No cursor for empty response
-        mock_client.app.bsky.feed.get_author_feed.return_value = mock_response
-
-        # Set up the platform
-        bluesky_platform._authenticated = True
-        bluesky_platform.client = mock_client
+        bluesky_platform, _, _ = authed_platform
 
         # Call get_posts
         posts = await bluesky_platform.get_posts(
@@ -224,21 +228,10 @@ class TestBlueskyAPIFixes:
         # Verify we got no posts
         assert len(posts) == 0
 
-    @pytest.mark.asyncio
-    async def test_get_posts_respects_limit_parameter(
-        self, bluesky_platform, mock_bluesky_config
-    ):
+    @pytest.mark.anyio
+    async def test_get_posts_respects_limit_parameter(self, authed_platform):
         """Test that get_posts respects the limit parameter in API calls."""
-        # Mock the client and response
-        mock_client = Mock()
-        mock_response = Mock()
-        mock_response.feed = []
-        mock_response.cursor = None  # No cursor
-        mock_client.app.bsky.feed.get_author_feed.return_value = mock_response
-
-        # Set up the platform
-        bluesky_platform._authenticated = True
-        bluesky_platform.client = mock_client
+        bluesky_platform, get_author_feed, _ = authed_platform
 
         # Call get_posts with specific limit
         await bluesky_platform.get_posts(
@@ -246,22 +239,15 @@ class TestBlueskyAPIFixes:
         )
 
         # Verify the API was called with correct limit
-        call_args = mock_client.app.bsky.feed.get_author_feed.call_args
+        call_args = get_author_feed.call_args
         params = call_args[0][0]
         assert params["limit"] == 25
 
-    @pytest.mark.asyncio
-    async def test_get_posts_handles_api_exception(
-        self, bluesky_platform, mock_bluesky_config
-    ):
+    @pytest.mark.anyio
+    async def test_get_posts_handles_api_exception(self, authed_platform):
         """Test that get_posts properly handles API exceptions by returning empty list."""
-        # Mock the client to raise an exception
-        mock_client = Mock()
-        mock_client.app.bsky.feed.get_author_feed.side_effect = Exception("API Error")
-
-        # Set up the platform
-        bluesky_platform._authenticated = True
-        bluesky_platform.client = mock_client
+        bluesky_platform, get_author_feed, _ = authed_platform
+        get_author_feed.side_effect = Exception("API Error")
 
         # Should return empty list instead of raising exception
         posts = await bluesky_platform.get_posts(
@@ -270,3 +256,197 @@ class TestBlueskyAPIFixes:
 
         # Verify it returns empty list when there's an API error
         assert posts == []
+
+    @pytest.mark.anyio
+    async def test_get_posts_drops_prefetch_when_date_range_ends(self, authed_platform):
+        """Test that the prefetched next page is cancelled once posts get too old."""
+        bluesky_platform, get_author_feed, response = authed_platform
+        # Before the date range
+        response.feed = [make_feed_item(created_at="2023-12-31T12:00:00Z")]
+        response.cursor = "next_cursor"
+
+        posts = await bluesky_platform.get_posts(
+            start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 2)
+        )
+        await asyncio.sleep(0)
+
+        assert posts == []
+        get_author_feed.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_get_posts_requests_full_pages_without_limit(self, authed_platform):
+        """Test that an unlimited scan asks for the largest page the API allows."""
+        bluesky_platform, get_author_feed, _ = authed_platform
+
+        await bluesky_platform.get_posts(
+            start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 2)
+        )
+
+        params = get_author_feed.call_args[0][0]
+        assert params["limit"] == 100
+
+    @pytest.mark.anyio
+    async def test_get_posts_builds_web_url_from_record_key(self, authed_platform):
+        """Test that the post URL ends with the record key of its URI."""
+        bluesky_platform, _, response = authed_platform
+        response.feed = [make_feed_item(rkey="abc123", text="Hello")]
+
+        posts = await bluesky_platform.get_posts(
+            start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 2)
+        )
+
+        assert posts[0].url == "https://bsky.app/profile/test.bsky.social/post/abc123"
+
+    @pytest.mark.anyio
+    async def test_delete_post_rejects_uri_without_record_key(self, bluesky_platform):
+        """Test that a post ID that isn't a URI is reported as invalid."""
+        bluesky_platform._authenticated = True
+        bluesky_platform.client = Mock()
+
+        result = await bluesky_platform.delete_post("not-a-uri")
+
+        assert not result.success
+        assert result.error == "Invalid post URI format"
+
+    @pytest.mark.anyio
+    async def test_delete_post_passes_repo_and_record_key(self, bluesky_platform):
+        """Test that the repo DID and record key are both taken from the URI."""
+        bluesky_platform._authenticated = True
+        bluesky_platform.client = Mock()
+        bluesky_platform.client.me.did = "did:plc:test"
+
+        result = await bluesky_platform.delete_post(
+            "at://did:plc:test/app.bsky.feed.post/abc123"
+        )
+
+        assert result.success
+        bluesky_platform.client.app.bsky.feed.post.delete.assert_called_once_with(
+            "did:plc:test", "abc123"
+        )
+
+    @pytest.mark.anyio
+    async def test_delete_post_skips_other_accounts_posts(self, bluesky_platform):
+        """Test that another account's post fails without a delete request."""
+        bluesky_platform._authenticated = True
+        bluesky_platform.client = Mock()
+        bluesky_platform.client.me.did = "did:plc:test"
+
+        result = await bluesky_platform.delete_post(
+            "at://did:plc:other/app.bsky.feed.post/abc123"
+        )
+
+        assert not result.success
+        assert result.error == NOT_OWN_POST_ERROR
+        bluesky_platform.client.app.bsky.feed.post.delete.assert_not_called()
+
+
+class TestBlueskyAuthenticate:
+    """Test cases for BlueskyPlatform.authenticate."""
+
+    @pytest.mark.anyio
+    async def test_authenticate_reuses_client(self, bluesky_platform):
+        """Test that logging in again keeps the same client and connection pool."""
+        with patch("social_scrubber.platforms.bluesky.Client") as MockClient:
+            assert await bluesky_platform.authenticate() is True
+            assert await bluesky_platform.authenticate() is True
+
+        MockClient.assert_called_once_with()
+        assert MockClient.return_value.login.call_count == 2
+
+
+class TestBlueskyDeletePosts:
+    """Test cases for batched Bluesky deletion."""
+
+    POST_IDS = [
+        "at://did:plc:test/app.bsky.feed.post/abc",
+        "at://did:plc:test/app.bsky.feed.post/def",
+        "at://did:plc:other/app.bsky.feed.post/ghi",
+    ]
+
+    @pytest.fixture
+    def authenticated_platform(self, bluesky_platform):
+        """Create a BlueskyPlatform logged in as did:plc:test."""
+        bluesky_platform._authenticated = True
+        bluesky_platform.client = Mock()
+        bluesky_platform.client.me.did = "did:plc:test"
+        return bluesky_platform
+
+    @pytest.mark.anyio
+    async def test_delete_posts_batches_own_posts(self, authenticated_platform):
+        """Test that the account's own posts go out in one applyWrites call."""
+        client = authenticated_platform.client
+
+        results = await authenticated_platform.delete_posts(self.POST_IDS)
+
+        assert [r.post_id for r in results] == self.POST_IDS
+        assert [r.success for r in results] == [True, True, False]
+        client.com.atproto.repo.apply_writes.assert_called_once()
+        data = client.com.atproto.repo.apply_writes.call_args.args[0]
+        assert data.repo == "did:plc:test"
+        assert [write.rkey for write in data.writes] == ["abc", "def"]
+        # The reposted post from another repo can't be deleted, so isn't tried
+        assert results[2].error == NOT_OWN_POST_ERROR
+        client.app.bsky.feed.post.delete.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_delete_posts_falls_back_when_batch_fails(
+        self, authenticated_platform, caplog
+    ):
+        """Test that a rejected batch is retried one post at a time."""
+        client = authenticated_platform.client
+        client.com.atproto.repo.apply_writes.side_effect = BadRequestError()
+        client.app.bsky.feed.post.delete.side_effect = [True, Exception("gone")]
+
+        with caplog.at_level(logging.WARNING):
+            results = await authenticated_platform.delete_posts(self.POST_IDS)
+
+        assert [r.success for r in results] == [True, False, False]
+        assert results[1].error == "gone"
+        assert client.app.bsky.feed.post.delete.call_count == 2
+        assert "deleting them one by one" in caplog.text
+
+    @pytest.mark.anyio
+    async def test_delete_posts_fails_batch_on_other_errors(
+        self, authenticated_platform
+    ):
+        """Test that a throttled batch isn't retried as one request per post."""
+        client = authenticated_platform.client
+        client.com.atproto.repo.apply_writes.side_effect = NetworkError()
+
+        results = await authenticated_platform.delete_posts(self.POST_IDS[:2])
+
+        assert [r.success for r in results] == [False, False]
+        client.app.bsky.feed.post.delete.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_delete_posts_bills_each_write(self, authenticated_platform):
+        """Test that a batch takes one rate limit token per write."""
+        authenticated_platform._rate_limiter = Mock(acquire=AsyncMock())
+
+        await authenticated_platform.delete_posts(self.POST_IDS[:2])
+
+        authenticated_platform._rate_limiter.acquire.assert_awaited_once_with(2)
+
+
+class TestBlueskyRateLimits:
+    """Test recognizing Bluesky rate limit errors on older atproto releases."""
+
+    @pytest.mark.parametrize(
+        "status_code,headers,expected",
+        [
+            (429, {"ratelimit-reset": "1704067230"}, 30.0),
+            (429, {}, 0.0),
+            (500, {"ratelimit-reset": "1704067230"}, None),
+        ],
+        ids=["reset_header", "no_header", "not_rate_limited"],
+    )
+    def test_retry_after_reads_plain_request_exception(
+        self, bluesky_platform, status_code, headers, expected
+    ):
+        """Test that a 429 is recognized by its status without RateLimitExceededError."""
+        error = RequestException(Mock(status_code=status_code, headers=headers))
+
+        with patch(
+            "social_scrubber.platforms.bluesky.RateLimitExceededError", None
+        ), freeze_time("2024-01-01T00:00:00Z"):
+            assert bluesky_platform._retry_after(error) == expected
@@ -0,0 +1,92 @@
+"""Test the post listing cache."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+from social_scrubber.cache import PostCache
+from social_scrubber.platforms.base import Post
+
+
+def make_post(post_id="1", platform="bluesky"):
+    """Create a post for caching."""
+    return Post(
+        id=post_id,
+        content="Hello",
+        created_at=datetime(2024, 1, 1, 12, 30),
+        platform=platform,
+        url="https://example.com/1",
+        metadata={"cid": "abc"},
+    )
+
+
+class TestPostCache:
+    """Test PostCache."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that cached posts come back unchanged."""
+        cache = PostCache(str(tmp_path))
+        key = cache.make_key(
+            "bluesky", "alice", datetime(2024, 1, 1), datetime(2024, 1, 31), 10
+        )
+
+        assert cache.get(key) is None
+        cache.set(key, [make_post()])
+
+        assert cache.get(key) == [make_post()]
+
+    def test_key_ignores_seconds(self):
+        """Test that relative date ranges a few seconds apart share a key."""
+        first = PostCache.make_key(
+            "bluesky",
+            "alice",
+            datetime(2024, 1, 1, 0, 0, 5),
+            datetime(2024, 1, 8, 0, 0, 5),
+        )
+        second = PostCache.make_key(
+            "bluesky",
+            "alice",
+            datetime(2024, 1, 1, 0, 0, 40),
+            datetime(2024, 1, 8, 0, 0, 40),
+        )
+
+        assert first == second
+        assert first != PostCache.make_key(
+            "mastodon", "alice", datetime(2024, 1, 1), datetime(2024, 1, 8)
+        )
+
+    def test_key_separates_accounts(self):
+        """Test that listings of different accounts never share a key."""
+        start, end = datetime(2024, 1, 1), datetime(2024, 1, 8)
+
+        assert PostCache.make_key("bluesky", "alice", start, end) != (
+            PostCache.make_key("bluesky", "bob", start, end)
+        )
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        """Test that entries older than the TTL are ignored."""
+        cache = PostCache(str(tmp_path), ttl=300)
+        key = cache.make_key(
+            "bluesky", "alice", datetime(2024, 1, 1), datetime(2024, 1, 31)
+        )
+
+        with patch("social_scrubber.cache.time.time", return_value=1000.0):
+            cache.set(key, [make_post()])
+        with patch("social_scrubber.cache.time.time", return_value=1301.0):
+            assert cache.get(key) is None
+
+    def test_invalidate_only_drops_that_platform(self, tmp_path):
+        """Test that invalidating one platform leaves the others cached."""
+        cache = PostCache(str(tmp_path))
+        bluesky_key = cache.make_key(
+            "bluesky", "alice", datetime(2024, 1, 1), datetime(2024, 1, 31)
+        )
+        mastodon_key = cache.make_key(
+            "mastodon", "alice", datetime(2024, 1, 1), datetime(2024, 1, 31)
+        )
+        cache.set(bluesky_key, [make_post()])
+        cache.set(mastodon_key, [make_post(platform="mastodon")])
+
+        cache.invalidate("bluesky")
+
+        assert cache.get(bluesky_key) is None
+        assert cache.get(mastodon_key) is not None
@@ -0,0 +1,405 @@
+"""Tests for concurrent platform operations in the CLI."""
+
+import asyncio
+from datetime import datetime, timezone
+from functools import partial
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from social_scrubber.cli import SocialScrubber, _run_archive
+from social_scrubber.platforms.base import DeletionResult, Post
+
+from .conftest import iter_posts, make_config, make_platforms, make_scrubber
+
+
+def make_post(post_id="1"):
+    """Create a Bluesky post that survives a round trip through the cache."""
+    return Post(
+        id=post_id,
+        content="Hello",
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        platform="bluesky",
+    )
+
+
+@pytest.fixture
+def mock_config():
+    """Create a configuration with all platforms configured."""
+    return make_config()
+
+
+@pytest.fixture
+def mock_platforms():
+    """Create mock platforms with async methods."""
+    return make_platforms()
+
+
+@pytest.fixture
+def scrubber(mock_config, mock_platforms):
+    """Create a SocialScrubber instance with mocked dependencies."""
+    return make_scrubber(mock_config, mock_platforms)
+
+
+class TestConcurrentAuthentication:
+    """Test cases for concurrent platform authentication."""
+
+    @pytest.mark.anyio
+    async def test_authenticate_platforms_returns_result_per_platform(
+        self, scrubber, mock_platforms
+    ):
+        """Test that every selected platform is authenticated."""
+        mock_platforms["mastodon"].authenticate.return_value = False
+
+        with patch("social_scrubber.cli.console"):
+            results = await scrubber.authenticate_platforms(["bluesky", "mastodon"])
+
+        assert results == {"bluesky": True, "mastodon": False}
+        mock_platforms["bluesky"].authenticate.assert_awaited_once()
+        mock_platforms["mastodon"].authenticate.assert_awaited_once()
+        mock_platforms["twitter"].authenticate.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_authenticate_platforms_maps_exceptions_to_failure(
+        self, scrubber, mock_platforms
+    ):
+        """Test that a platform raising during login does not abort the others."""
+        mock_platforms["bluesky"].authenticate.side_effect = Exception("boom")
+
+        with patch("social_scrubber.cli.console"):
+            results = await scrubber.authenticate_platforms(None)
+
+        assert results == {"bluesky": False, "mastodon": True, "twitter": True}
+
+    @pytest.mark.anyio
+    async def test_authenticate_platforms_skips_unknown_platforms(self, scrubber):
+        """Test that unknown platform names are ignored."""
+        with patch("social_scrubber.cli.console"):
+            results = await scrubber.authenticate_platforms(["bluesky", "unknown"])
+
+        assert results == {"bluesky": True}
+
+    @pytest.mark.anyio
+    async def test_close_releases_every_platform(self, scrubber, mock_platforms):
+        """Test that closing the scrubber closes every platform session."""
+        mock_platforms["bluesky"].close.side_effect = Exception("boom")
+
+        await scrubber.close()
+
+        for platform in mock_platforms.values():
+            platform.close.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_test_connections_reports_every_platform(
+        self, scrubber, mock_platforms
+    ):
+        """Test that a connection error on one platform doesn't hide the others."""
+        mock_platforms["bluesky"].authenticate.side_effect = Exception("boom")
+        mock_platforms["mastodon"].authenticate.return_value = False
+
+        with patch("social_scrubber.cli.console") as mock_console:
+            await scrubber.test_connections()
+
+        for platform in mock_platforms.values():
+            platform.authenticate.assert_awaited_once()
+        mock_console.print.assert_any_call("❌ Bluesky: Connection error - boom")
+        mock_console.print.assert_any_call("❌ Mastodon: Authentication failed")
+        mock_console.print.assert_any_call("✅ Twitter: Connection successful")
+        mock_console.print.assert_any_call("✅ Successful connections: 1/3")
+
+
+class TestConcurrentFetch:
+    """Test cases for concurrent post fetching."""
+
+    @pytest.mark.anyio
+    async def test_get_posts_from_platforms_preserves_platform_order(
+        self, scrubber, mock_platforms
+    ):
+        """Test that results keep the requested order even if completion differs."""
+        slow = asyncio.Event()
+
+        async def slow_get_posts(*args):
+            await slow.wait()
+            return ["bluesky-post"]
+
+        async def fast_get_posts(*args):
+            slow.set()
+            return ["mastodon-post"]
+
+        mock_platforms["bluesky"].get_posts = slow_get_posts
+        mock_platforms["mastodon"].get_posts = fast_get_posts
+
+        with patch("social_scrubber.cli.console"):
+            all_posts, total_posts = await scrubber.get_posts_from_platforms(
+                ["bluesky", "mastodon"], Mock(), Mock(), 10
+            )
+
+        assert total_posts == 2
+        assert list(all_posts) == ["bluesky", "mastodon"]
+        assert all_posts["bluesky"] == ["bluesky-post"]
+        assert all_posts["mastodon"] == ["mastodon-post"]
+
+    @pytest.mark.anyio
+    async def test_get_posts_from_platforms_isolates_errors(
+        self, scrubber, mock_platforms
+    ):
+        """Test that one failing platform yields an empty list for that platform."""
+        mock_platforms["bluesky"].get_posts = AsyncMock(side_effect=Exception("boom"))
+        mock_platforms["mastodon"].get_posts = AsyncMock(return_value=["post"])
+        mock_platforms["twitter"].is_authenticated = False
+
+        with patch("social_scrubber.cli.console"):
+            all_posts, total_posts = await scrubber.get_posts_from_platforms(
+                ["bluesky", "mastodon", "twitter"], Mock(), Mock()
+            )
+
+        assert all_posts == {"bluesky": [], "mastodon": ["post"]}
+        assert total_posts == 1
+
+    @pytest.mark.anyio
+    async def test_run_interactive_without_limit_fetches_every_platform(
+        self, scrubber, mock_config, mock_platforms, cli_patches
+    ):
+        """Test that max_posts_per_scrub=0 (unlimited) skips no platform."""
+        mock_config.scrub.max_posts_per_scrub = 0
+        mock_platforms["bluesky"].get_posts = AsyncMock(return_value=["a"] * 5)
+        mock_platforms["mastodon"].get_posts = AsyncMock(return_value=["b"] * 3)
+
+        cli_patches["authenticate_platforms"].return_value = {
+            "bluesky": True,
+            "mastodon": True,
+        }
+        # Fetch through the real method, so the platforms' get_posts are used
+        cli_patches["iter_posts_from_platforms"].side_effect = partial(
+            SocialScrubber.iter_posts_from_platforms, scrubber
+        )
+        mock_delete = cli_patches["delete_posts_from_platform"]
+        mock_delete.return_value = []
+
+        await scrubber.run_interactive(["bluesky", "mastodon"])
+
+        for platform_name in ["bluesky", "mastodon"]:
+            get_posts = mock_platforms[platform_name].get_posts
+            get_posts.assert_awaited_once()
+            assert get_posts.await_args[0][2] == 0
+        deleted = {call.args[0]: call.args[1] for call in mock_delete.await_args_list}
+        assert deleted == {"bluesky": ["a"] * 5, "mastodon": ["b"] * 3}
+
+    @pytest.mark.anyio
+    async def test_iter_posts_from_platforms_yields_in_completion_order(
+        self, scrubber, mock_platforms
+    ):
+        """Test that each platform's posts are yielded as soon as they arrive."""
+        bluesky_may_finish = asyncio.Event()
+
+        async def slow_get_posts(*args):
+            await bluesky_may_finish.wait()
+            return ["a"]
+
+        async def fast_get_posts(*args):
+            return ["b"]
+
+        mock_platforms["bluesky"].get_posts = slow_get_posts
+        mock_platforms["mastodon"].get_posts = fast_get_posts
+
+        yielded = []
+        with patch("social_scrubber.cli.console"):
+            async for platform_name, posts in scrubber.iter_posts_from_platforms(
+                ["bluesky", "mastodon"], Mock(), Mock()
+            ):
+                yielded.append((platform_name, posts))
+                bluesky_may_finish.set()
+
+        assert yielded == [("mastodon", ["b"]), ("bluesky", ["a"])]
+
+    @pytest.mark.anyio
+    async def test_iter_posts_from_platforms_cancels_when_caller_stops(
+        self, scrubber, mock_platforms
+    ):
+        """Test that fetches still running are cancelled if iteration stops early."""
+        cancelled = asyncio.Event()
+
+        async def never_finishes(*args):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        mock_platforms["bluesky"].get_posts = never_finishes
+        mock_platforms["mastodon"].get_posts = AsyncMock(return_value=["b"])
+
+        with patch("social_scrubber.cli.console"):
+            posts_iter = scrubber.iter_posts_from_platforms(
+                ["bluesky", "mastodon"], Mock(), Mock()
+            )
+            assert await posts_iter.__anext__() == ("mastodon", ["b"])
+            await posts_iter.aclose()
+
+        assert cancelled.is_set()
+
+
+class TestConcurrentDeletion:
+    """Test cases for concurrent per-platform deletion."""
+
+    @pytest.mark.anyio
+    async def test_run_interactive_deletes_from_all_platforms(
+        self, scrubber, mock_config, cli_patches
+    ):
+        """Test that a failing platform deletion does not hide other results."""
+        mock_config.scrub.dry_run = False
+        mock_config.scrub.archive_before_delete = False
+        mock_config.scrub.max_posts_per_scrub = 10
+
+        async def fake_delete(platform_name, posts, dry_run=True, progress=None):
+            if platform_name == "bluesky":
+                raise Exception("boom")
+            return ["result"]
+
+        cli_patches["authenticate_platforms"].return_value = {
+            "bluesky": True,
+            "mastodon": True,
+        }
+        cli_patches["iter_posts_from_platforms"].return_value = iter_posts(
+            {"bluesky": ["a"], "mastodon": ["b"]}
+        )
+        cli_patches["delete_posts_from_platform"].side_effect = fake_delete
+
+        await scrubber.run_interactive(["bluesky", "mastodon"])
+
+        cli_patches["display_deletion_results"].assert_called_once_with(
+            ["result"], "mastodon"
+        )
+
+    @pytest.mark.anyio
+    async def test_archive_shows_all_posts_in_one_table(self, scrubber, cli_patches):
+        """Test that the archive command renders every platform's posts at once."""
+        cli_patches["authenticate_platforms"].return_value = {
+            "bluesky": True,
+            "mastodon": True,
+        }
+        cli_patches["confirm_action"].side_effect = [True, False]
+
+        with patch.object(
+            scrubber, "get_posts_from_platforms", AsyncMock()
+        ) as mock_get_posts:
+            mock_get_posts.return_value = (
+                {"bluesky": ["a"], "mastodon": ["b", "c"]},
+                3,
+            )
+
+            await _run_archive(scrubber, ["bluesky", "mastodon"])
+
+        cli_patches["display_posts_table"].assert_called_once_with(
+            ["a", "b", "c"], "All Posts"
+        )
+
+    @pytest.mark.anyio
+    async def test_archive_directory_is_prepared_once(self, scrubber, mock_config):
+        """Test that the archive directory is only created once per run."""
+        mock_config.scrub.archive_path = "./archives"
+
+        with patch(
+            "social_scrubber.cli.ensure_archive_directory", return_value=True
+        ) as mock_ensure:
+            assert await scrubber._prepare_archive_directory() is True
+            assert await scrubber._prepare_archive_directory() is True
+
+        mock_ensure.assert_called_once_with("./archives")
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(
+        "log_level, expect_lines", [("INFO", False), ("DEBUG", True)]
+    )
+    async def test_per_post_lines_only_printed_at_debug(
+        self, scrubber, mock_config, mock_platforms, log_level, expect_lines
+    ):
+        """Test that per-post deletion lines are gated behind DEBUG logging."""
+        mock_config.log_level = log_level
+        mock_config.scrub.archive_before_delete = False
+        mock_config.scrub.max_concurrent_deletes = 4
+        result = DeletionResult(post_id="1", success=True)
+
+        async def fake_bulk_delete(posts, on_result=None, max_concurrency=None, **kw):
+            assert max_concurrency == 4
+            on_result(result)
+            return [result]
+
+        mock_platforms["bluesky"].bulk_delete_posts = fake_bulk_delete
+        progress = Mock()
+
+        with patch("social_scrubber.cli.console"):
+            results = await scrubber.delete_posts_from_platform(
+                "bluesky", ["post"], dry_run=False, progress=progress
+            )
+
+        assert results == [result]
+        progress.advance.assert_called_once()
+        assert progress.console.print.called is expect_lines
+
+
+class TestPostCaching:
+    """Test cases for caching post listings across CLI runs."""
+
+    @pytest.fixture
+    def cached_platform(self, mock_config, mock_platforms, tmp_path):
+        """Enable the post cache and return a platform to fetch from."""
+        mock_config.scrub.post_cache_ttl = 300
+        mock_config.scrub.archive_path = str(tmp_path)
+
+        platform = mock_platforms["bluesky"]
+        platform.name = "bluesky"
+        platform.account = "test.bsky.social"
+        return platform
+
+    @pytest.mark.anyio
+    async def test_repeated_fetch_is_served_from_cache(self, scrubber, cached_platform):
+        """Test that a second identical fetch within the TTL skips the platform."""
+        post = make_post()
+        cached_platform.get_posts = AsyncMock(return_value=[post])
+        start, end = datetime(2024, 1, 1), datetime(2024, 1, 2)
+
+        with patch("social_scrubber.cli.console"):
+            first, _ = await scrubber.get_posts_from_platforms(["bluesky"], start, end)
+            second, _ = await scrubber.get_posts_from_platforms(["bluesky"], start, end)
+
+        assert first == second == {"bluesky": [post]}
+        cached_platform.get_posts.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_cached_listing_expires_after_ttl(self, scrubber, cached_platform):
+        """Test that posts are fetched again once the cached listing is too old."""
+        cached_platform.get_posts = AsyncMock(return_value=[make_post()])
+        start, end = datetime(2024, 1, 1), datetime(2024, 1, 2)
+
+        with patch("social_scrubber.cache.time.time", return_value=1000.0):
+            await scrubber._cached_get_posts(cached_platform, start, end)
+        with patch("social_scrubber.cache.time.time", return_value=1301.0):
+            await scrubber._cached_get_posts(cached_platform, start, end)
+
+        assert cached_platform.get_posts.await_count == 2
+
+    @pytest.mark.anyio
+    async def test_other_account_is_not_served_from_cache(
+        self, scrubber, cached_platform
+    ):
+        """Test that switching accounts never lists the previous account's posts."""
+        cached_platform.get_posts = AsyncMock(side_effect=[[make_post()], []])
+        start, end = datetime(2024, 1, 1), datetime(2024, 1, 2)
+
+        await scrubber._cached_get_posts(cached_platform, start, end)
+        cached_platform.account = "other.bsky.social"
+
+        assert await scrubber._cached_get_posts(cached_platform, start, end) == []
+
+    @pytest.mark.anyio
+    async def test_failed_fetch_is_not_cached(self, scrubber, cached_platform):
+        """Test that a fetch error reaches the caller and is not cached."""
+        post = make_post()
+        cached_platform.get_posts = AsyncMock(side_effect=[Exception("boom"), [post]])
+        start, end = datetime(2024, 1, 1), datetime(2024, 1, 2)
+
+        with pytest.raises(Exception, match="boom"):
+            await scrubber._cached_get_posts(cached_platform, start, end)
+        assert await scrubber._cached_get_posts(cached_platform, start, end) == [post]
+        assert cached_platform.get_posts.await_count == 2
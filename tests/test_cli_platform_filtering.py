@@ -1,306 +1,241 @@
 """Tests for CLI platform filtering functionality."""
 
-from unittest.mock import AsyncMock, Mock, patch
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
 
+import click
 import pytest
+from click.testing import CliRunner
 
-from social_scrubber.cli import SocialScrubber
-from social_scrubber.config import Config
+from social_scrubber.cli import SocialScrubber, cli, scrub
 
+from .conftest import iter_posts, make_config, make_platforms, make_scrubber
 
-@pytest.fixture
-def mock_config():
-    """Create a mock configuration with all platforms configured."""
-    config = Mock(spec=Config)
-
-    # Mock platform configs
-    config.bluesky = Mock()
-    config.bluesky.is_configured = True
-    config.mastodon = Mock()
-    config.mastodon.is_configured = True
-    config.twitter = Mock()
-    config.twitter.is_configured = True
+REPO_ROOT = Path(__file__).resolve().parent.parent
 
-    # Mock scrub config
-    config.scrub = Mock()
-    config.scrub.get_start_datetime.return_value = Mock()
-    config.scrub.get_end_datetime.return_value = Mock()
-    config.scrub.max_posts_per_scrub = 100
-    config.scrub.dry_run = True
 
-    # Mock log level as string
-    config.log_level = "INFO"
-
-    return config
+@pytest.fixture(scope="module")
+def mock_config():
+    """Create a configuration with all platforms configured."""
+    return make_config(max_posts_per_scrub=100, dry_run=True)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_platforms():
     """Create mock platform instances."""
-    platforms = {}
-    for platform_name in ["bluesky", "mastodon", "twitter"]:
-        platform = Mock()
-        platform.is_authenticated = False
-        platforms[platform_name] = platform
-    return platforms
+    return make_platforms(is_authenticated=False)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def scrubber(mock_config, mock_platforms):
     """Create a SocialScrubber instance with mocked dependencies."""
-    with patch("social_scrubber.cli.Config") as MockConfig, patch(
-        "social_scrubber.cli.setup_logging"
-    ):  # noqa: F841 (we don't use mock_setup_logging but need to patch it)
-        MockConfig.from_env.return_value = mock_config
+    return make_scrubber(mock_config, mock_platforms)
 
-        scrubber = SocialScrubber()
-        scrubber.platforms = mock_platforms
 
-        return scrubber
+@pytest.fixture(scope="module")
+def runner():
+    """Create a Click test runner shared by the module's CLI invocations."""
+    return CliRunner()
 
 
-class TestPlatformFiltering:
-    """Test cases for platform filtering in CLI."""
+@pytest.fixture(autouse=True)
+def restore_shared_fixtures(request, mock_config, mock_platforms):
+    """Undo the changes a test made to the module-scoped mocks and scrubber."""
+    yield
 
-    @pytest.mark.asyncio
-    async def test_run_interactive_no_platform_filter(self, scrubber, mock_config):
-        """Test that all configured platforms are processed when no filter is applied."""
-        # Mock the methods that run_interactive calls
-        with patch.object(
-            scrubber, "authenticate_platforms"
-        ) as mock_auth, patch.object(
-            scrubber, "get_posts_from_platforms"
-        ) as mock_get_posts, patch.object(
-            scrubber, "delete_posts_from_platform"
-        ), patch(  # noqa: F841 (we don't use mock_delete but need to patch it)
-            "social_scrubber.cli.print_banner"
-        ), patch(
-            "social_scrubber.cli.console"
-        ), patch(  # noqa: F841 (we don't use mock_console but need to patch it)
-            "social_scrubber.cli.print_platform_status"
-        ), patch(
-            "social_scrubber.cli.confirm_action"
-        ) as mock_confirm, patch(
-            "social_scrubber.cli.format_date_range"
-        ), patch(
-            "social_scrubber.cli.display_posts_table"
-        ), patch(
-            "social_scrubber.cli.display_deletion_results"
-        ):
+    mock_config.bluesky.is_configured = True
+    mock_config.mastodon.is_configured = True
+    mock_config.twitter.is_configured = True
+    for platform in mock_platforms.values():
+        platform.reset_mock()
+        platform.is_authenticated = False
 
-            # Setup mocks
-            mock_auth.return_value = {
-                "bluesky": True,
-                "mastodon": True,
-                "twitter": True,
-            }
-            mock_get_posts.return_value = {"bluesky": [], "mastodon": [], "twitter": []}
-            mock_confirm.return_value = True
+    if "scrubber" in request.fixturenames:
+        # Configured platforms are cached on first use, so drop them for the
+        # next test to work them out from its own config
+        request.getfixturevalue("scrubber").__dict__.pop("configured_platforms", None)
 
-            # Run without platform filter
-            await scrubber.run_interactive(None)
 
-            # Verify all platforms were passed to authenticate_platforms
-            mock_auth.assert_called_once_with(["bluesky", "mastodon", "twitter"])
+class TestPlatformFiltering:
+    """Test cases for platform filtering in CLI."""
 
-    @pytest.mark.asyncio
-    async def test_run_interactive_with_single_platform_filter(
-        self, scrubber, mock_config
+    @pytest.mark.parametrize(
+        "platform_filter,expected",
+        [
+            (None, ["bluesky", "mastodon", "twitter"]),
+            (["bluesky"], ["bluesky"]),
+            (["bluesky", "mastodon"], ["bluesky", "mastodon"]),
+        ],
+        ids=["no_filter", "single", "multiple"],
+    )
+    @pytest.mark.anyio
+    async def test_run_interactive_platform_filter(
+        self, scrubber, cli_patches, platform_filter, expected
     ):
-        """Test that only selected platform is processed when filter is applied."""
-        with patch.object(
-            scrubber, "authenticate_platforms"
-        ) as mock_auth, patch.object(
-            scrubber, "get_posts_from_platforms"
-        ) as mock_get_posts, patch.object(
-            scrubber, "delete_posts_from_platform"
-        ), patch(  # noqa: F841 (we don't use mock_delete but need to patch it)
-            "social_scrubber.cli.print_banner"
-        ), patch(
-            "social_scrubber.cli.console"
-        ), patch(  # noqa: F841 (we don't use mock_console but need to patch it)
-            "social_scrubber.cli.print_platform_status"
-        ), patch(
-            "social_scrubber.cli.confirm_action"
-        ) as mock_confirm, patch(
-            "social_scrubber.cli.format_date_range"
-        ), patch(
-            "social_scrubber.cli.display_posts_table"
-        ), patch(
-            "social_scrubber.cli.display_deletion_results"
-        ):
-
-            # Setup mocks
-            mock_auth.return_value = {"bluesky": True}
-            mock_get_posts.return_value = {"bluesky": []}
-            mock_confirm.return_value = True
-
-            # Run with single platform filter
-            await scrubber.run_interactive(["bluesky"])
+        """Test that only the selected, or else all configured, platforms are processed."""
+        cli_patches["authenticate_platforms"].return_value = {
+            name: True for name in expected
+        }
+        cli_patches["iter_posts_from_platforms"].return_value = iter_posts(
+            {name: [] for name in expected}
+        )
 
-            # Verify only selected platform was passed to authenticate_platforms
-            mock_auth.assert_called_once_with(["bluesky"])
-
-    @pytest.mark.asyncio
-    async def test_run_interactive_with_multiple_platform_filter(
-        self, scrubber, mock_config
-    ):
-        """Test that multiple selected platforms are processed when filter is applied."""
-        with patch.object(
-            scrubber, "authenticate_platforms"
-        ) as mock_auth, patch.object(
-            scrubber, "get_posts_from_platforms"
-        ) as mock_get_posts, patch.object(
-            scrubber, "delete_posts_from_platform"
-        ), patch(  # noqa: F841 (we don't use mock_delete but need to patch it)
-            "social_scrubber.cli.print_banner"
-        ), patch(
-            "social_scrubber.cli.console"
-        ), patch(  # noqa: F841 (we don't use mock_console but need to patch it)
-            "social_scrubber.cli.print_platform_status"
-        ), patch(
-            "social_scrubber.cli.confirm_action"
-        ) as mock_confirm, patch(
-            "social_scrubber.cli.format_date_range"
-        ), patch(
-            "social_scrubber.cli.display_posts_table"
-        ), patch(
-            "social_scrubber.cli.display_deletion_results"
-        ):
+        await scrubber.run_interactive(platform_filter)
 
-            # Setup mocks
-            mock_auth.return_value = {"bluesky": True, "mastodon": True}
-            mock_get_posts.return_value = {"bluesky": [], "mastodon": []}
-            mock_confirm.return_value = True
+        # Verify only the expected platforms were passed to authenticate_platforms
+        cli_patches["authenticate_platforms"].assert_called_once_with(expected)
 
-            # Run with multiple platform filter
-            await scrubber.run_interactive(["bluesky", "mastodon"])
-
-            # Verify only selected platforms were passed to authenticate_platforms
-            mock_auth.assert_called_once_with(["bluesky", "mastodon"])
-
-    @pytest.mark.asyncio
-    async def test_run_interactive_invalid_platform_filter(self, scrubber, mock_config):
+    @pytest.mark.anyio
+    async def test_run_interactive_invalid_platform_filter(self, scrubber, cli_patches):
         """Test that invalid platform names are handled correctly."""
-        with patch("social_scrubber.cli.print_banner"), patch(
-            "social_scrubber.cli.console"
-        ) as mock_console, patch("social_scrubber.cli.print_platform_status"):
+        # Run with invalid platform filter
+        await scrubber.run_interactive(["invalid_platform"])
 
-            # Run with invalid platform filter
-            await scrubber.run_interactive(["invalid_platform"])
-
-            # Verify error message was printed
-            mock_console.print.assert_any_call(
-                "\n❌ Invalid or not configured platforms: invalid_platform"
-            )
+        # Verify error message was printed
+        cli_patches["console"].print.assert_any_call(
+            "\n❌ Invalid or not configured platforms: invalid_platform"
+        )
 
-    @pytest.mark.asyncio
+    @pytest.mark.anyio
     async def test_run_interactive_unconfigured_platform_filter(
-        self, scrubber, mock_config
+        self, scrubber, mock_config, cli_patches
     ):
         """Test that unconfigured platforms are handled correctly."""
         # Make twitter unconfigured
         mock_config.twitter.is_configured = False
 
-        with patch("social_scrubber.cli.print_banner"), patch(
-            "social_scrubber.cli.console"
-        ) as mock_console, patch("social_scrubber.cli.print_platform_status"):
+        # Run with unconfigured platform filter
+        await scrubber.run_interactive(["twitter"])
 
-            # Run with unconfigured platform filter
-            await scrubber.run_interactive(["twitter"])
+        # Verify error message was printed
+        cli_patches["console"].print.assert_any_call(
+            "\n❌ Invalid or not configured platforms: twitter"
+        )
 
-            # Verify error message was printed
-            mock_console.print.assert_any_call(
-                "\n❌ Invalid or not configured platforms: twitter"
-            )
-
-    @pytest.mark.asyncio
+    @pytest.mark.anyio
     async def test_run_interactive_mixed_valid_invalid_platforms(
-        self, scrubber, mock_config
+        self, scrubber, cli_patches
     ):
         """Test that mix of valid and invalid platforms is handled correctly."""
-        with patch("social_scrubber.cli.print_banner"), patch(
-            "social_scrubber.cli.console"
-        ) as mock_console, patch("social_scrubber.cli.print_platform_status"):
-
-            # Run with mix of valid and invalid platforms
-            await scrubber.run_interactive(["bluesky", "invalid_platform"])
+        # Run with mix of valid and invalid platforms
+        await scrubber.run_interactive(["bluesky", "invalid_platform"])
 
-            # Verify error message was printed
-            mock_console.print.assert_any_call(
-                "\n❌ Invalid or not configured platforms: invalid_platform"
-            )
+        # Verify error message was printed
+        cli_patches["console"].print.assert_any_call(
+            "\n❌ Invalid or not configured platforms: invalid_platform"
+        )
 
-    @pytest.mark.asyncio
-    async def test_run_interactive_no_configured_platforms(self, scrubber, mock_config):
+    @pytest.mark.anyio
+    async def test_run_interactive_no_configured_platforms(
+        self, scrubber, mock_config, cli_patches
+    ):
         """Test behavior when no platforms are configured."""
         # Make all platforms unconfigured
         mock_config.bluesky.is_configured = False
         mock_config.mastodon.is_configured = False
         mock_config.twitter.is_configured = False
 
-        with patch("social_scrubber.cli.print_banner"), patch(
-            "social_scrubber.cli.console"
-        ) as mock_console, patch("social_scrubber.cli.print_platform_status"):
+        # Run without platform filter
+        await scrubber.run_interactive(None)
 
-            # Run without platform filter
-            await scrubber.run_interactive(None)
+        # Verify error message was printed
+        cli_patches["console"].print.assert_called_with(
+            "\n❌ No platforms are configured. Please check your .env file."
+        )
 
-            # Verify error message was printed
-            mock_console.print.assert_called_with(
-                "\n❌ No platforms are configured. Please check your .env file."
-            )
+    def test_only_configured_platforms_are_instantiated(self, mock_config):
+        """Test that platforms are built lazily, and only when configured."""
+        mock_config.mastodon.is_configured = False
+        mock_config.twitter.is_configured = False
+
+        with patch("social_scrubber.cli.Config") as MockConfig, patch(
+            "social_scrubber.cli.setup_logging"
+        ), patch(
+            "social_scrubber.platforms.bluesky.BlueskyPlatform"
+        ) as MockBluesky, patch(
+            "social_scrubber.platforms.mastodon.MastodonPlatform"
+        ) as MockMastodon, patch(
+            "social_scrubber.platforms.twitter.TwitterPlatform"
+        ) as MockTwitter:
+            MockConfig.from_env.return_value = mock_config
+
+            scrubber = SocialScrubber()
+            MockBluesky.assert_not_called()
+
+            assert list(scrubber.platforms) == ["bluesky"]
+            assert scrubber.platforms is scrubber.platforms
+
+        MockBluesky.assert_called_once_with(mock_config.bluesky)
+        MockMastodon.assert_not_called()
+        MockTwitter.assert_not_called()
+
+    def test_platform_sdks_are_not_imported_with_cli(self):
+        """Test that importing the CLI doesn't import any platform SDK."""
+        code = (
+            "import sys, social_scrubber.cli; "
+            "print(sorted(m for m in ('atproto', 'mastodon') if m in sys.modules))"
+        )
+        # Import this checkout wherever pytest was started from
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")])
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=REPO_ROOT,
+            env=env,
+        )
+
+        assert result.stdout.strip() == "[]"
 
 
 class TestCLIPlatformParsing:
     """Test cases for CLI platform argument parsing."""
 
-    def test_scrub_command_platform_parsing_single(self):
-        """Test that single platform string is parsed correctly."""
-        from click.testing import CliRunner
-
-        from social_scrubber.cli import cli
-
-        runner = CliRunner()
-
-        with patch("asyncio.run") as mock_run:
-            result = runner.invoke(cli, ["scrub", "--platforms=bluesky", "--dry-run"])
-
-            # Verify asyncio.run was called with correct platforms argument
-            assert mock_run.called
-            args, kwargs = mock_run.call_args
-            # The argument should be a coroutine, we can't inspect it directly
-            # But we can verify the command succeeded
-            assert result.exit_code == 0
-
-    def test_scrub_command_platform_parsing_multiple(self):
-        """Test that multiple platforms string is parsed correctly."""
-        from click.testing import CliRunner
-
-        from social_scrubber.cli import cli
-
-        runner = CliRunner()
-
-        with patch("asyncio.run") as mock_run:
+    @pytest.mark.parametrize(
+        "platforms,expected",
+        [
+            ("bluesky", ["bluesky"]),
+            ("bluesky, mastodon", ["bluesky", "mastodon"]),
+            (None, None),
+        ],
+        ids=["single", "multiple", "no_filter"],
+    )
+    def test_scrub_command_platform_parsing(self, platforms, expected):
+        """Test that the --platforms value is split into the platforms to run."""
+        with patch("social_scrubber.cli.SocialScrubber") as mock_scrubber, patch(
+            "asyncio.run", side_effect=lambda coro: coro.close()
+        ) as mock_run:
+            # Call the command's function directly, without parsing any argv
+            with click.Context(scrub, obj={}):
+                scrub.callback(
+                    dry_run=True,
+                    max_posts=None,
+                    platforms=platforms,
+                    start_date=None,
+                    end_date=None,
+                )
+
+        mock_scrubber.return_value.run_interactive.assert_called_once_with(expected)
+        assert mock_run.called
+
+    def test_scrub_command_parses_argv(self, runner):
+        """Test that the scrub command accepts its options from the command line."""
+        with patch("social_scrubber.cli.SocialScrubber") as mock_scrubber, patch(
+            "asyncio.run", side_effect=lambda coro: coro.close()
+        ):
             result = runner.invoke(
                 cli, ["scrub", "--platforms=bluesky,mastodon", "--dry-run"]
             )
 
-            # Verify asyncio.run was called
-            assert mock_run.called
-            assert result.exit_code == 0
-
-    def test_scrub_command_no_platform_filter(self):
-        """Test that no platform filter works correctly."""
-        from click.testing import CliRunner
-
-        from social_scrubber.cli import cli
-
-        runner = CliRunner()
-
-        with patch("asyncio.run") as mock_run:
-            result = runner.invoke(cli, ["scrub", "--dry-run"])
-
-            # Verify asyncio.run was called
-            assert mock_run.called
-            assert result.exit_code == 0
+        assert result.exit_code == 0
+        assert mock_scrubber.return_value.config.scrub.dry_run is True
+        mock_scrubber.return_value.run_interactive.assert_called_once_with(
+            ["bluesky", "mastodon"]
+        )
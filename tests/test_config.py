@@ -1,33 +1,82 @@
 """Test configuration module."""
 
-import os
-from datetime import datetime, timedelta
+import time
+from dataclasses import FrozenInstanceError
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 import pytest
+from freezegun import freeze_time
 
+from social_scrubber import config as config_module
 from social_scrubber.config import BlueskyConfig, Config, MastodonConfig, ScrubConfig
 
 
 class TestConfig:
     """Test configuration classes."""
 
+    @freeze_time("2024-06-01T12:00:00")
     def test_scrub_config_default_dates(self):
         """Test default date parsing in ScrubConfig."""
         config = ScrubConfig()
 
-        # Test default start date (7 days ago)
-        start_date = config.get_start_datetime()
-        expected_start = datetime.now() - timedelta(days=7)
+        # Default start date is 7 days ago, and the end date is now
+        assert config.get_start_datetime() == datetime(
+            2024, 5, 25, 12, tzinfo=timezone.utc
+        )
+        assert config.get_end_datetime() == datetime(
+            2024, 6, 1, 12, tzinfo=timezone.utc
+        )
 
-        # Allow for some time difference in test execution
-        assert abs((start_date - expected_start).total_seconds()) < 60
+    def test_post_cache_is_off_by_default(self, monkeypatch):
+        """Test that post listings are only cached once a TTL is configured."""
+        monkeypatch.delenv("POST_CACHE_TTL", raising=False)
+
+        assert ScrubConfig().post_cache_ttl == 0
+        assert Config.from_env().scrub.post_cache_ttl == 0
+
+    @pytest.mark.skipif(not hasattr(time, "tzset"), reason="needs time.tzset")
+    def test_scrub_config_today_starts_at_local_midnight(self, monkeypatch):
+        """Test that a "today" start date is the user's local midnight, in UTC."""
+        monkeypatch.setenv("TZ", "America/Los_Angeles")
+        time.tzset()
+        try:
+            config = ScrubConfig(start_date="today")
+            # 01:00 UTC on June 1st is still May 31st in Los Angeles (UTC-7)
+            config._now = datetime(2024, 6, 1, 1, tzinfo=timezone.utc)
+
+            assert config.get_start_datetime() == datetime(
+                2024, 5, 31, 7, tzinfo=timezone.utc
+            )
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+    def test_scrub_config_relative_dates_share_one_now(self):
+        """Test that relative start and end dates use the same current time."""
+        config = ScrubConfig()
 
-        # Test default end date (today)
+        start_date = config.get_start_datetime()
         end_date = config.get_end_datetime()
-        expected_end = datetime.now()
 
-        # Allow for some time difference in test execution
-        assert abs((end_date - expected_end).total_seconds()) < 60
+        assert end_date - start_date == timedelta(days=7)
+        assert config.get_start_datetime() is start_date
+
+    def test_scrub_config_reparses_changed_dates(self):
+        """Test that overriding a date after parsing takes effect."""
+        config = ScrubConfig(start_date="2024-01-01T00:00:00")
+        assert config.get_start_datetime().day == 1
+
+        config.start_date = "2024-01-05T00:00:00"
+
+        assert config.get_start_datetime().day == 5
+
+    def test_scrub_config_invalid_date(self):
+        """Test that an unparseable date raises a ValueError."""
+        config = ScrubConfig(end_date="not-a-date")
+
+        with pytest.raises(ValueError, match="Invalid end date format"):
+            config.get_end_datetime()
 
     def test_scrub_config_custom_dates(self):
         """Test custom date parsing in ScrubConfig."""
@@ -46,6 +95,10 @@ class TestConfig:
         assert end_date.month == 1
         assert end_date.day == 31
 
+        # Naive ISO dates are taken as UTC
+        assert start_date.tzinfo == timezone.utc
+        assert end_date.tzinfo == timezone.utc
+
     def test_bluesky_config_validation(self):
         """Test BlueskyConfig validation."""
         # Empty config should not be configured
@@ -76,6 +129,14 @@ class TestConfig:
         )
         assert config.is_configured
 
+    def test_platform_configs_are_frozen(self):
+        """Test that platform credentials can't change under a cached is_configured."""
+        config = BlueskyConfig(handle="test.bsky.social", password="test-password")
+        assert config.is_configured
+
+        with pytest.raises(FrozenInstanceError):
+            config.password = ""
+
     def test_config_from_env(self, monkeypatch):
         """Test Config.from_env() method."""
         # Set some environment variables using monkeypatch for automatic cleanup
@@ -83,6 +144,7 @@ class TestConfig:
         monkeypatch.setenv("BLUESKY_PASSWORD", "test-password")
         monkeypatch.setenv("DRY_RUN", "false")
         monkeypatch.setenv("MAX_POSTS_PER_SCRUB", "25")
+        monkeypatch.setenv("MAX_CONCURRENT_DELETES", "4")
 
         config = Config.from_env()
 
@@ -90,5 +152,17 @@ class TestConfig:
         assert config.bluesky.password == "test-password"
         assert config.scrub.dry_run is False
         assert config.scrub.max_posts_per_scrub == 25
+        assert config.scrub.max_concurrent_deletes == 4
 
         # No manual cleanup needed - monkeypatch handles it automatically
+
+    def test_config_from_env_loads_dotenv_once(self):
+        """Test that the .env file is only read on the first from_env() call."""
+        config_module._load_dotenv.cache_clear()
+
+        with patch("social_scrubber.config.load_dotenv") as mock_load_dotenv:
+            Config.from_env()
+            Config.from_env()
+
+        mock_load_dotenv.assert_called_once_with()
+        config_module._load_dotenv.cache_clear()
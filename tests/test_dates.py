@@ -0,0 +1,31 @@
+"""Test the shared date helpers."""
+
+from datetime import datetime, timedelta, timezone
+
+from social_scrubber.dates import to_utc
+
+
+class TestToUtc:
+    """Test to_utc."""
+
+    def test_aware_datetime_is_converted_to_utc(self):
+        """Test that aware datetimes are shifted to UTC."""
+        eastern = timezone(timedelta(hours=-5))
+        value = datetime(2024, 1, 1, 7, 0, tzinfo=eastern)
+
+        converted = to_utc(value)
+
+        assert converted.tzinfo is timezone.utc
+        assert converted.hour == 12
+
+    def test_naive_datetime_is_assumed_utc(self):
+        """Test that naive datetimes are assumed to already be UTC."""
+        value = datetime(2024, 1, 1, 12, 0)
+
+        assert to_utc(value) == datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+    def test_utc_datetime_is_returned_as_is(self):
+        """Test that datetimes already in UTC are not copied."""
+        value = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+        assert to_utc(value) is value
@@ -0,0 +1,230 @@
+"""Tests for the Mastodon platform."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from social_scrubber.config import MastodonConfig
+from social_scrubber.platforms.mastodon import MastodonPlatform
+
+
+@pytest.fixture
+def mastodon_platform():
+    """Create an authenticated MastodonPlatform with a mocked client."""
+    platform = MastodonPlatform(
+        MastodonConfig(api_base_url="https://mastodon.social", access_token="token")
+    )
+    platform.client = Mock()
+    platform._account_id = "42"
+    platform._authenticated = True
+    return platform
+
+
+def make_status(status_id, created_at, content="<p>Hello</p>"):
+    """Create a status dict as returned by Mastodon.py."""
+    return {
+        "id": status_id,
+        "created_at": created_at,
+        "content": content,
+        "url": f"https://mastodon.social/@test/{status_id}",
+        "visibility": "public",
+        "replies_count": 0,
+        "reblogs_count": 0,
+        "favourites_count": 0,
+    }
+
+
+def snowflake_id(created_at):
+    """Build a Mastodon status ID for a creation time."""
+    return str(int(created_at.timestamp() * 1000) << 16)
+
+
+class TestMastodonAuthenticate:
+    """Test cases for MastodonPlatform.authenticate."""
+
+    @pytest.mark.anyio
+    async def test_authenticate_remembers_account_id(self):
+        """Test that the account looked up at login is kept for later calls."""
+        platform = MastodonPlatform(
+            MastodonConfig(api_base_url="https://mastodon.social", access_token="token")
+        )
+
+        with patch("social_scrubber.platforms.mastodon.Mastodon") as MockMastodon:
+            MockMastodon.return_value.me.return_value = {"id": "42", "username": "me"}
+            assert await platform.authenticate() is True
+
+        assert platform.is_authenticated
+        assert platform._account_id == "42"
+        assert MockMastodon.call_args.kwargs["version_check_mode"] == "none"
+        await platform.close()
+
+
+class TestMastodonGetPosts:
+    """Test cases for MastodonPlatform.get_posts."""
+
+    @pytest.mark.anyio
+    async def test_get_posts_uses_account_id_from_login(self, mastodon_platform):
+        """Test that pagination doesn't look the account up again for every page."""
+        client = mastodon_platform.client
+        client.account_statuses.side_effect = [
+            [make_status(2, datetime(2024, 1, 2, tzinfo=timezone.utc))],
+            [make_status(1, datetime(2024, 1, 1, 12, tzinfo=timezone.utc))],
+            [],
+        ]
+
+        posts = await mastodon_platform.get_posts(
+            start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 3)
+        )
+
+        assert [post.id for post in posts] == ["2", "1"]
+        client.me.assert_not_called()
+        assert client.account_statuses.call_count == 3
+        assert all(
+            call.kwargs["id"] == "42" for call in client.account_statuses.call_args_list
+        )
+
+    @pytest.mark.anyio
+    async def test_get_posts_strips_html_tags(self, mastodon_platform):
+        """Test that status HTML is reduced to its text."""
+        mastodon_platform.client.account_statuses.side_effect = [
+            [
+                make_status(
+                    1,
+                    datetime(2024, 1, 1, 12, tzinfo=timezone.utc),
+                    content='<p>Hi <a href="https://example.com">there</a></p>',
+                )
+            ],
+            [],
+        ]
+
+        posts = await mastodon_platform.get_posts(
+            start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 3)
+        )
+
+        assert posts[0].content == "Hi there"
+
+    @pytest.mark.anyio
+    async def test_get_posts_seeks_to_past_end_date(self, mastodon_platform):
+        """Test that a past window is jumped to by ID on a snowflake-ID server."""
+        client = mastodon_platform.client
+        newest = datetime(2024, 2, 1, tzinfo=timezone.utc)
+        last_second = datetime(2024, 1, 2, 23, 59, 59, 500000, tzinfo=timezone.utc)
+        client.account_statuses.side_effect = [
+            [make_status(snowflake_id(newest), newest)],
+            [make_status(snowflake_id(last_second), last_second)],
+            [],
+        ]
+
+        posts = await mastodon_platform.get_posts(
+            start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 3)
+        )
+
+        calls = client.account_statuses.call_args_list
+        assert calls[0].kwargs["max_id"] is None
+        # One second of slack, so posts from the window's last second are kept
+        assert calls[1].kwargs["max_id"] == snowflake_id(
+            datetime(2024, 1, 3, 0, 0, 1, tzinfo=timezone.utc)
+        )
+        assert [post.created_at for post in posts] == [last_second]
+
+    @pytest.mark.anyio
+    async def test_get_posts_pages_from_newest_without_snowflake_ids(
+        self, mastodon_platform
+    ):
+        """Test that servers such as GoToSocial are paged through, not seeked."""
+        client = mastodon_platform.client
+        client.account_statuses.side_effect = [
+            [
+                make_status(
+                    "01HNBXKX0000NEWER", datetime(2024, 2, 1, tzinfo=timezone.utc)
+                )
+            ],
+            [
+                make_status(
+                    "01HK5R4C0000INSIDE", datetime(2024, 1, 2, tzinfo=timezone.utc)
+                )
+            ],
+            [],
+        ]
+
+        posts = await mastodon_platform.get_posts(
+            start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 3)
+        )
+
+        calls = client.account_statuses.call_args_list
+        assert calls[1].kwargs["max_id"] == "01HNBXKX0000NEWER"
+        assert [post.id for post in posts] == ["01HK5R4C0000INSIDE"]
+
+    @pytest.mark.anyio
+    async def test_get_posts_starts_at_newest_for_current_window(
+        self, mastodon_platform
+    ):
+        """Test that a window ending now pages from the newest post."""
+        client = mastodon_platform.client
+        client.account_statuses.return_value = []
+
+        await mastodon_platform.get_posts(
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime.now(timezone.utc) + timedelta(minutes=1),
+        )
+
+        assert client.account_statuses.call_args.kwargs["max_id"] is None
+
+    @pytest.mark.anyio
+    async def test_get_posts_normalizes_dates_to_utc(self, mastodon_platform):
+        """Test that status dates are converted to UTC without losing precision."""
+        offset = timezone(timedelta(hours=2))
+        mastodon_platform.client.account_statuses.side_effect = [
+            [make_status(1, datetime(2024, 1, 1, 14, 0, 0, 123456, tzinfo=offset))],
+            [],
+        ]
+
+        posts = await mastodon_platform.get_posts(
+            start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 3)
+        )
+
+        created_at = posts[0].created_at
+        assert created_at.tzinfo is timezone.utc
+        assert created_at.replace(tzinfo=None) == datetime(2024, 1, 1, 12, 0, 0, 123456)
+
+
+class TestMastodonIterPosts:
+    """Test cases for MastodonPlatform.iter_posts."""
+
+    @pytest.mark.anyio
+    async def test_iter_posts_fetches_pages_on_demand(self, mastodon_platform):
+        """Test that a page is only requested once the previous one is used up."""
+        client = mastodon_platform.client
+        client.account_statuses.side_effect = [
+            [make_status(2, datetime(2024, 1, 2, tzinfo=timezone.utc))],
+            [make_status(1, datetime(2024, 1, 1, 12, tzinfo=timezone.utc))],
+            [],
+        ]
+
+        posts = mastodon_platform.iter_posts(
+            start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 3)
+        )
+        first = await posts.__anext__()
+        await posts.aclose()
+
+        assert first.id == "2"
+        assert client.account_statuses.call_count == 1
+
+    @pytest.mark.anyio
+    async def test_iter_posts_raises_errors(self, mastodon_platform):
+        """Test that API errors reach the caller instead of ending the listing."""
+        mastodon_platform.client.account_statuses.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            async for _ in mastodon_platform.iter_posts(
+                start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 3)
+            ):
+                pass
+
+        assert (
+            await mastodon_platform.get_posts(
+                start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 3)
+            )
+            == []
+        )
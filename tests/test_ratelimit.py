@@ -0,0 +1,71 @@
+"""Test client-side rate limiting."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from social_scrubber.platforms._ratelimit import AsyncTokenBucket
+
+
+class FakeClock:
+    """Monotonic clock that only moves when the bucket sleeps."""
+
+    def __init__(self):
+        """Start the clock at zero."""
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        """Return the current fake time."""
+        return self.now
+
+    async def sleep(self, seconds):
+        """Advance the fake time instead of waiting."""
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """Patch the rate limiter's clock and sleep."""
+    fake = FakeClock()
+    with patch(
+        "social_scrubber.platforms._ratelimit.time.monotonic", fake.monotonic
+    ), patch("social_scrubber.platforms._ratelimit.asyncio.sleep", fake.sleep):
+        yield fake
+
+
+class TestAsyncTokenBucket:
+    """Test AsyncTokenBucket."""
+
+    @pytest.mark.anyio
+    async def test_burst_is_not_delayed(self, clock):
+        """Test that up to burst requests go out without waiting."""
+        bucket = AsyncTokenBucket(rate=2, burst=3)
+
+        for _ in range(3):
+            await bucket.acquire()
+
+        assert clock.sleeps == []
+
+    @pytest.mark.anyio
+    async def test_requests_beyond_burst_are_paced(self, clock):
+        """Test that once the burst is used up requests follow the rate."""
+        bucket = AsyncTokenBucket(rate=2, burst=1)
+
+        await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+
+        assert clock.sleeps == [0.5, 0.5]
+        assert clock.now == 1.0
+
+    @pytest.mark.anyio
+    async def test_costly_request_takes_several_tokens(self, clock):
+        """Test that a request costing more than the burst waits for the refill."""
+        bucket = AsyncTokenBucket(rate=2, burst=2)
+
+        await bucket.acquire(tokens=3)
+
+        assert clock.sleeps == [0.5]
+        await bucket.acquire()
+        assert clock.sleeps == [0.5, 0.5]
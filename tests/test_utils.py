@@ -0,0 +1,138 @@
+"""Tests for the logging and display helpers."""
+
+import logging
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler
+from unittest.mock import patch
+
+import pytest
+
+from social_scrubber import utils
+from social_scrubber.platforms.base import DeletionResult, Post
+from social_scrubber.utils import (
+    MAX_TABLE_ROWS,
+    display_deletion_results,
+    display_posts_table,
+    setup_logging,
+)
+
+
+def make_post(content, created_at=datetime(2024, 1, 1, 12, 30, 45), platform="bluesky"):
+    """Create a post for display."""
+    return Post(
+        id="at://did:plc:test/app.bsky.feed.post/abcdefghijkl",
+        content=content,
+        created_at=created_at,
+        platform=platform,
+    )
+
+
+def stop_listener(listener):
+    """Flush a log listener's queue and close its handlers."""
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+@pytest.fixture
+def log_setup(monkeypatch, tmp_path):
+    """Let setup_logging run from scratch, cleaning up its listener afterwards."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(utils, "_log_listener", None)
+    monkeypatch.setattr(utils.atexit, "register", lambda func: None)
+    root = logging.getLogger()
+    saved_level = root.level
+    yield
+    if utils._log_listener is not None:
+        stop_listener(utils._log_listener)
+    root.setLevel(saved_level)
+
+
+class TestSetupLogging:
+    """Test setup_logging."""
+
+    def test_records_are_written_by_a_background_listener(self, log_setup):
+        """Test that log calls only enqueue, and the listener writes the file."""
+        with patch.object(logging.getLogger(), "handlers", []) as handlers:
+            setup_logging("INFO")
+            assert [type(h) for h in handlers] == [QueueHandler]
+            logging.getLogger("social_scrubber.test").info("hello")
+
+        stop_listener(utils._log_listener)
+        utils._log_listener = None
+        with open("social_scrubber.log", encoding="utf-8") as f:
+            assert "social_scrubber.test - INFO - hello" in f.read()
+
+    def test_calling_again_only_changes_the_level(self, log_setup):
+        """Test that a --log-level override takes effect without new handlers."""
+        with patch.object(logging.getLogger(), "handlers", []) as handlers:
+            setup_logging("INFO")
+            setup_logging("DEBUG")
+            assert len(handlers) == 1
+
+        assert logging.getLogger().level == logging.DEBUG
+
+
+class TestDisplayPostsTable:
+    """Test display_posts_table."""
+
+    def render_rows(self, posts):
+        """Return the cell values of the table printed for some posts."""
+        with patch("social_scrubber.utils.console") as mock_console:
+            display_posts_table(posts, "Posts")
+
+        table = mock_console.print.call_args[0][0]
+        return [list(column.cells) for column in table.columns]
+
+    def test_rows_are_formatted_for_display(self):
+        """Test the platform, date, preview and ID columns."""
+        platforms, dates, previews, ids = self.render_rows(
+            [make_post("Line one\nline two\r\n" + "x" * 60)]
+        )
+
+        assert platforms == ["Bluesky"]
+        assert dates == ["2024-01-01 12:30"]
+        assert previews == ["Line one line two  " + "x" * 31 + "..."]
+        assert ids == ["abcdefghijkl"]
+
+    def test_short_content_and_aware_dates(self):
+        """Test that short content isn't marked as cut and offsets are hidden."""
+        _, dates, previews, _ = self.render_rows(
+            [make_post("Hi", datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc))]
+        )
+
+        assert dates == ["2024-01-01 12:30"]
+        assert previews == ["Hi"]
+
+    def test_long_listings_are_printed_as_lines(self):
+        """Test that listings over MAX_TABLE_ROWS skip the table layout."""
+        posts = [make_post("[red]Hi[/red]")] * (MAX_TABLE_ROWS + 1)
+
+        with patch("social_scrubber.utils.console") as mock_console:
+            display_posts_table(posts, "Posts")
+
+        lines = mock_console.print.call_args.args[0].split("\n")
+        assert len(lines) == MAX_TABLE_ROWS + 1
+        assert lines[0] == "Bluesky\t2024-01-01 12:30\t[red]Hi[/red]\tabcdefghijkl"
+        assert mock_console.print.call_args.kwargs["markup"] is False
+
+
+class TestDisplayDeletionResults:
+    """Test display_deletion_results."""
+
+    def test_summary_counts_and_failures(self):
+        """Test that the summary counts each outcome and lists the failures."""
+        results = [
+            DeletionResult(post_id="1", success=True, archived=True),
+            DeletionResult(post_id="2", success=True),
+            DeletionResult(post_id="3", success=False, error="boom", archived=True),
+        ]
+
+        with patch("social_scrubber.utils.console") as mock_console:
+            display_deletion_results(results, "bluesky")
+
+        panel = mock_console.print.call_args_list[0][0][0]
+        assert panel.renderable == (
+            "✅ Successfully deleted: 2\n❌ Failed to delete: 1\n📁 Archived: 2"
+        )
+        mock_console.print.assert_called_with("  • Post 3: boom")